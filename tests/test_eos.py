@@ -961,6 +961,10 @@ def test_APISRK_quick():
     assert_close(eos.T, 299)
     T_slow = eos.solve_T(P=1E6, V=7.184693818446427e-05)
     assert_close(T_slow, 299)
+    # The squared alpha term has spurious roots at very high T
+    eos = APISRK(Tc=507.6, Pc=3025000., S1=1.678665, S2=-0.216396, P=1e5, V=5e-4)
+    assert_close(eos.T, 445.2670244114121, rtol=1e-9)
+    assert_close(eos.solve_T(1e5, 1e-3), 363.3893814009396, rtol=1e-9)
 
 
     eos = APISRK(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
@@ -2192,6 +2196,10 @@ def test_MSRK():
     assert_close(eos.Tsat(101325), eos_SRK.Tsat(101325))
     assert_close(eos.Tsat(1333.2236842105262), eos_SRK.Tsat(1333.2236842105262))
 
+    # Repeated estimates come from the cache
+    assert MSRKTranslated.estimate_MN(Tc=647.3, Pc=221.2e5, omega=0.344) is MSRKTranslated.estimate_MN(Tc=647.3, Pc=221.2e5, omega=0.344)
+    assert_close1d(MSRKTranslated.estimate_MN(Tc=647.3, Pc=221.2e5, omega=0.344), eos.alpha_coeffs, rtol=1e-15)
+
 
 @pytest.mark.slow
 def test_eos_P_limits():
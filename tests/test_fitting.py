@@ -132,3 +132,18 @@ def test_Twu91_check_params_Bell():
 
     for (c0, c1, c2) in zip(v[:, 2], v[:, 3], v[:, 4]):
         assert Twu91_check_params((c0, c1, c2))
+
+def test_TRC_Antoine_extended_fit_analytical_jacobian():
+    from chemicals.vapor_pressure import TRC_Antoine_extended, TRC_Antoine_extended_fitting_jacobian
+    from thermo import VaporPressure
+    assert VaporPressure.correlation_models['TRC_Antoine_extended'][3]['fit_jac'] is TRC_Antoine_extended_fitting_jacobian
+    Tc = 227.51
+    params = {'to': -120., 'A': 8.95894, 'B': 510.595, 'C': -15.95, 'n': 2.41377, 'E': -93.74, 'F': 7425.9}
+    Ts = linspace(100.0, 225.0, 15)
+    data = [TRC_Antoine_extended(T, Tc, **params) for T in Ts]
+    res, stats = VaporPressure.fit_data_to_model(Ts=Ts, data=data, model='TRC_Antoine_extended',
+                          do_statistics=True, use_numba=False, fit_method='lm',
+                          model_kwargs={'Tc': Tc, 'to': -120.})
+    assert stats['MAE'] < 1e-10
+    for k in ('A', 'B', 'C', 'n', 'E', 'F'):
+        assert_close(res[k], params[k], rtol=1e-7)
@@ -21,7 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 import pytest
 from thermo.utils import TDependentProperty
-from fluids.numerics import assert_close
+from fluids.numerics import assert_close, assert_close1d
 from math import log
 
 def test_local_constant_method():
@@ -56,6 +56,25 @@ def test_local_constant_method():
     obj.add_method(constant, Tmin, Tmax)
     assert obj.T_dependent_property(T) is None
     
+def test_local_constant_method_array_T():
+    from thermo.utils.t_dependent_property import ConstantLocalMethod
+    import numpy as np
+    constant = 100.
+    obj = ConstantLocalMethod(constant)
+    Ts = np.linspace(300., 400., 5)
+    assert_close1d(obj.f(Ts), [constant]*5)
+    assert_close1d(obj.f_der(Ts), [0.]*5)
+    assert_close1d(obj.f_der3(Ts), [0.]*5)
+    assert_close1d(obj.f_int(300., Ts), constant*(Ts - 300.))
+    assert_close1d(obj.f_int_over_T(300., Ts), [constant*log(T/300.) for T in Ts])
+    assert obj.f(300.) == constant
+    # Integer temperatures must not truncate the value
+    Ts_int = np.array([300, 400])
+    obj = ConstantLocalMethod(100.5)
+    assert_close1d(obj.f(Ts_int), [100.5, 100.5])
+    assert obj.f(Ts_int).dtype == np.float64
+    assert obj.f_der(Ts_int).dtype == np.float64
+
 def test_local_method():
     # Test user defined method
     
@@ -177,4 +196,67 @@ def test_t_dependent_property_exceptions():
                                   "component with CASRN '7732-18-5'")
             raise error
         
-    
\ No newline at end of file
+    
+def test_test_property_validity_array():
+    import numpy as np
+    obj = TDependentProperty(extrapolation='linear')
+    obj.property_min, obj.property_max = 0.0, 1e4
+    props = np.array([-1.0, 0.0, 5.0, 1e4, 2e4])
+    expect = [obj.test_property_validity(float(v)) for v in props]
+    assert obj.test_property_validity(props).tolist() == expect
+    assert not obj.test_property_validity(props.astype(complex)).any()
+
+
+def test_fit_data_to_model_no_free_parameters():
+    from chemicals import EQ101
+    Ts = [300.0, 350.0, 400.0]
+    kwargs = {'A': 73.649, 'B': -7258.2, 'C': -7.3037, 'D': 4.1653e-06, 'E': 2.0}
+    data = [EQ101(T, **kwargs) for T in Ts]
+    for fit_method in ('lm', 'differential_evolution'):
+        coeffs, stats = TDependentProperty.fit_data_to_model(Ts=Ts, data=data, model='DIPPR101',
+                                                             model_kwargs=kwargs, do_statistics=True,
+                                                             fit_method=fit_method)
+        assert coeffs == kwargs
+        assert_close(stats['MAE'], 0.0, atol=1e-15)
+        assert stats['pcov'] is None
+
+
+def test_T_dependent_property_array():
+    import numpy as np
+    from thermo import VaporPressure
+    obj = VaporPressure(CASRN='7732-18-5', Tb=373.124, Tc=647.14, Pc=22048320.0, omega=0.344)
+    Ts = np.array([1.0, 200.0, 300.0, 400.0, 640.0, 700.0, np.nan])
+    for method in obj.all_methods:
+        obj.method = method
+        expect = [obj.T_dependent_property(T) for T in Ts.tolist()]
+        expect = [np.nan if v is None else v for v in expect]
+        assert_close1d(obj.T_dependent_property_array(Ts), expect, rtol=1e-13)
+    assert obj.T_dependent_property_array(Ts.reshape(7, 1)).shape == (7, 1)
+
+    obj.add_method(lambda T: 1e5*np.exp(10.0 - 3000.0/np.asarray(T)), Tmin=200.0, Tmax=500.0, name='numpy')
+    obj.extrapolation = None
+    assert_close1d(obj.T_dependent_property_array([250.0, 300.0]),
+                   [obj.T_dependent_property(250.0), obj.T_dependent_property(300.0)], rtol=1e-13)
+    assert np.isnan(obj.T_dependent_property_array([100.0, 600.0])).all()
+
+
+def test_T_dependent_property_derivative_array():
+    import numpy as np
+    from thermo import ViscosityGas
+    obj = ViscosityGas(CASRN='64-17-5')
+    Ts = np.array([150.0, 300.0, 500.0, 1500.0])
+    obj.method = 'DIPPR_PERRY_8E'
+    expect = [obj.T_dependent_property_derivative(T) for T in Ts.tolist()]
+    assert_close1d(obj.T_dependent_property_derivative_array(Ts), expect, rtol=1e-7)
+    assert obj.T_dependent_property_derivative_array(Ts.reshape(2, 2)).shape == (2, 2)
+
+    obj.add_correlation(name='D', model='DIPPR102', Tmin=200.0, Tmax=1000.0, A=1.0613e-07, B=0.8066, C=52.7, D=0.0)
+    expect = [obj.T_dependent_property_derivative(T) for T in Ts.tolist()]
+    assert_close1d(obj.T_dependent_property_derivative_array(Ts), expect, rtol=1e-13)
+
+    obj.add_method(lambda T: 1e-7*np.asarray(T)**0.7, f_der=lambda T: 0.7e-7*np.asarray(T)**-0.3,
+                   Tmin=200.0, Tmax=1000.0, name='numpy')
+    obj.extrapolation = None
+    assert_close1d(obj.T_dependent_property_derivative_array([250.0, 300.0]),
+                   [obj.T_dependent_property_derivative(250.0), obj.T_dependent_property_derivative(300.0)], rtol=1e-13)
+    assert np.isnan(obj.T_dependent_property_derivative_array([100.0, 1500.0])).all()
@@ -144,8 +144,7 @@ SRK Translated-Consistent
 -------------------------
 .. autoclass:: SRKTranslatedConsistent
    :show-inheritance:
-   :members: __init__
-   :exclude-members: __init__
+   :members: estimate_c_alpha_coeffs
 
 SRK Translated (Pina-Martinez, Privat, and Jaubert Variant)
 -----------------------------------------------------------
@@ -268,6 +267,7 @@ __all__.extend(['main_derivatives_and_departures',
 
 from cmath import log as clog
 from math import isnan, isinf
+from bisect import bisect_right
 from fluids.numerics import (chebval, brenth, third, sixth, roots_cubic,
                              roots_cubic_a1, numpy as np, newton,
                              bisect, inf, polyder, chebder, is_micropython,
@@ -275,7 +275,7 @@ from fluids.numerics import (chebval, brenth, third, sixth, roots_cubic,
                              horner, horner_and_der, horner_and_der2, derivative,
                              roots_cubic_a2, isclose, NoSolutionError,
                              roots_quartic, deflate_cubic_real_roots,
-                             catanh)
+                             catanh, UnconvergedError)
 
 from fluids.constants import mmHg, R
 
@@ -300,6 +300,18 @@ R_2 = 0.5*R
 R_inv = 1.0/R
 R_inv2 = R_inv*R_inv
 
+# Estimated (M, N) parameters of MSRKTranslated keyed by (Tc, Pc, omega, c);
+# each estimate requires two vapor pressure solves
+_MSRK_MN_cache = {}
+
+
+def _SRK_P_max_at_V(Tc, a, m, b, V):
+    # Closed form maximum isochoric pressure of the SRK EOS; see
+    # SRK.P_max_at_V for its derivation. None if there is no maximum.
+    P_max = -R*Tc*a*(m**2 + 2*m + 1)/(R*Tc*V**2 + R*Tc*V*b - V*a*m**2 + a*b*m**2)
+    if P_max < 0.0:
+        return None
+    return P_max
 
 
 def main_derivatives_and_departures(T, P, V, b, delta, epsilon, a_alpha,
@@ -2898,7 +2910,11 @@ class GCEOS(object):
         Tc, Pc = self.Tc, self.Pc
         if T == Tc:
             return Pc
-        a_alpha = self.a_alpha_and_derivatives(T, full=False)
+        if T == self.T:
+            # Already evaluated at this temperature when the EOS was solved
+            a_alpha = self.a_alpha
+        else:
+            a_alpha = self.a_alpha_and_derivatives(T, full=False)
         alpha = a_alpha/self.a
         Tr = T/self.Tc
         x = alpha/Tr - 1.
@@ -2920,9 +2936,11 @@ class GCEOS(object):
                     x = Psat_ranges_low[-1]
                     polish = True
 
-            for i in range(len(Psat_ranges_low)):
-                if x < Psat_ranges_low[i]:
-                    break
+            # Index of the first range boundary above x; x equal to the last
+            # boundary is evaluated with the last polynomial
+            i = bisect_right(Psat_ranges_low, x)
+            if i == len(Psat_ranges_low):
+                i -= 1
             y = 0.0
             for c in self.Psat_coeffs_low[i]:
                 y = y*x + c
@@ -3138,8 +3156,9 @@ class GCEOS(object):
         if Tr > 0.999 and not isinstance(self, RK):
             # OK
             x = alpha/Tr - 1.
-            y = horner(self.Psat_coeffs_critical, x)
-            dy_dT = T_inv*(Tc*d_alpha_dT - Tc*alpha*T_inv)*horner(self.Psat_coeffs_critical_der, x)
+            # Value and derivative of the polynomial in a single pass
+            y, dy = horner_and_der(self.Psat_coeffs_critical, x)
+            dy_dT = T_inv*(Tc*d_alpha_dT - Tc*alpha*T_inv)*dy
             dPsat_dT = Pc*(T*dy_dT*Tc_inv + y*Tc_inv)
             if also_Psat:
                 Psat = y*Tr*Pc
@@ -3152,9 +3171,9 @@ class GCEOS(object):
             if x > Psat_ranges_low[-1]:
                 raise NoSolutionError("T %.8f K is too low for equations to converge" %(T))
 
-            for i in range(len(Psat_ranges_low)):
-                if x < Psat_ranges_low[i]:
-                    break
+            i = bisect_right(Psat_ranges_low, x)
+            if i == len(Psat_ranges_low):
+                i -= 1
             y, dy = 0.0, 0.0
             for c in Psat_coeffs_low[i]:
                 dy = x*dy + y
@@ -3366,8 +3385,7 @@ class GCEOS(object):
         .. [1] Walas, Stanley M. Phase Equilibria in Chemical Engineering.
            Butterworth-Heinemann, 1985.
         '''
-        Psat = self.Psat(T)
-        dPsat_dT = self.dPsat_dT(T)
+        dPsat_dT, Psat = self.dPsat_dT(T, also_Psat=True)
         a_alpha = self.a_alpha_and_derivatives(T, full=False)
         Vs = self.volume_solutions(T, Psat, self.b, self.delta, self.epsilon, a_alpha)
         # Assume we can safely take the Vmax as gas, Vmin as l on the saturation line
@@ -9813,10 +9831,11 @@ class SRK(GCEOS):
         self.P = P
         self.V = V
 
-        self.a = self.c1*R*R*Tc*Tc/Pc
-        self.b = self.c2*R*Tc/Pc
-        self.m = 0.480 + 1.574*omega - 0.176*omega*omega
-        self.delta = self.b
+        self.b = b = self.c2R*Tc/Pc
+        self.a = b*Tc*self.c1R2_c2R
+        self.m = 0.480 + omega*(1.574 - 0.176*omega)
+        self.delta = b
+        self._inv_sqrt_Tc = 1.0/sqrt(Tc)
         self.solve()
 
     def a_alpha_and_derivatives_pure(self, T):
@@ -9851,11 +9870,14 @@ class SRK(GCEOS):
             Second temperature derivative of coefficient calculated by
             EOS-specific method, [J^2/mol^2/Pa/K^2]
         '''
-        a, Tc, m = self.a, self.Tc, self.m
-        sqTr = (T/Tc)**0.5
-        a_alpha = a*(m*(1. - sqTr) + 1.)**2
-        da_alpha_dT = -a*m*sqTr*(m*(-sqTr + 1.) + 1.)/T
-        d2a_alpha_dT2 =  a*m*sqTr*(m + 1.)/(2.*T*T)
+        a, m = self.a, self.m
+        sqTr = sqrt(T)*self._inv_sqrt_Tc
+        x0 = m*(1.0 - sqTr) + 1.0
+        T_inv = 1.0/T
+        x1 = a*m*sqTr*T_inv
+        a_alpha = a*x0*x0
+        da_alpha_dT = -x1*x0
+        d2a_alpha_dT2 = 0.5*x1*(m + 1.0)*T_inv
         return a_alpha, da_alpha_dT, d2a_alpha_dT2
 
     def a_alpha_pure(self, T):
@@ -9876,8 +9898,8 @@ class SRK(GCEOS):
         a_alpha : float
             Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
         '''
-        a, Tc, m = self.a, self.Tc, self.m
-        sqTr = sqrt(T/Tc)
+        a, m = self.a, self.m
+        sqTr = sqrt(T)*self._inv_sqrt_Tc
         x0 = (m*(1. - sqTr) + 1.)
         return a*x0*x0
 
@@ -9920,15 +9942,7 @@ class SRK(GCEOS):
         hit = solve(Eq(lhs, rhs), P)
         '''
         # grows unbounded for all mixture EOS?
-        try:
-            Tc, a, m, b = self.Tc, self.a, self.m, self.b
-        except:
-            Tc, a, m, b = self.Tcs[0], self.ais[0], self.ms[0], self.bs[0]
-
-        P_max = -R*Tc*a*(m**2 + 2*m + 1)/(R*Tc*V**2 + R*Tc*V*b - V*a*m**2 + a*b*m**2)
-        if P_max < 0.0:
-            return None
-        return P_max
+        return _SRK_P_max_at_V(self.Tc, self.a, self.m, self.b, V)
 
 
     def solve_T(self, P, V, solution=None):
@@ -9963,71 +9977,50 @@ class SRK(GCEOS):
         >>> SRK = R*T/(V-b) - a_alpha/(V*(V+b)) - P # doctest:+SKIP
         >>> solve(SRK, T) # doctest:+SKIP
         '''
-        # Takes like half an hour to be derived, saved here for convenience
-#         ([(Tc*(V - b)*(R**2*Tc**2*V**4 + 2*R**2*Tc**2*V**3*b + R**2*Tc**2*V**2*b**2
-#        - 2*R*Tc*V**3*a*m**2 + 2*R*Tc*V*a*b**2*m**2 + V**2*a**2*m**4 - 2*V*a**2*b*m**4
-#        + a**2*b**2*m**4)*(P*R*Tc*V**4 + 2*P*R*Tc*V**3*b + P*R*Tc*V**2*b**2
-#                        - P*V**3*a*m**2 + P*V*a*b**2*m**2 + R*Tc*V**2*a*m**2
-#                        + 2*R*Tc*V**2*a*m + R*Tc*V**2*a + R*Tc*V*a*b*m**2
-#                        + 2*R*Tc*V*a*b*m + R*Tc*V*a*b + V*a**2*m**4 + 2*V*a**2*m**3
-#                        + V*a**2*m**2 - a**2*b*m**4 - 2*a**2*b*m**3 - a**2*b*m**2)
-#                - 2*sqrt(Tc**2*V*a**2*m**2*(V - b)**3*(V + b)*(m + 1)**2*(P*R*Tc*V**2
-#                         + P*R*Tc*V*b - P*V*a*m**2 + P*a*b*m**2 + R*Tc*a*m**2 + 2*R*Tc*a*m + R*Tc*a))*(R*Tc*V**2 + R*Tc*V*b - V*a*m**2 + a*b*m**2)**2)/((R*Tc*V**2 + R*Tc*V*b - V*a*m**2 + a*b*m**2)**2*(R**2*Tc**2*V**4 + 2*R**2*Tc**2*V**3*b + R**2*Tc**2*V**2*b**2 - 2*R*Tc*V**3*a*m**2 + 2*R*Tc*V*a*b**2*m**2 + V**2*a**2*m**4 - 2*V*a**2*b*m**4 + a**2*b**2*m**4)),
-#        (Tc*(V - b)*(R**2*Tc**2*V**4 + 2*R**2*Tc**2*V**3*b + R**2*Tc**2*V**2*b**2
-#        - 2*R*Tc*V**3*a*m**2 + 2*R*Tc*V*a*b**2*m**2 + V**2*a**2*m**4 - 2*V*a**2*b*m**4
-#        + a**2*b**2*m**4)*(P*R*Tc*V**4 + 2*P*R*Tc*V**3*b + P*R*Tc*V**2*b**2
-#                        - P*V**3*a*m**2 + P*V*a*b**2*m**2 + R*Tc*V**2*a*m**2
-#                        + 2*R*Tc*V**2*a*m + R*Tc*V**2*a + R*Tc*V*a*b*m**2
-#                        + 2*R*Tc*V*a*b*m + R*Tc*V*a*b + V*a**2*m**4 + 2*V*a**2*m**3
-#                        + V*a**2*m**2 - a**2*b*m**4 - 2*a**2*b*m**3 - a**2*b*m**2)
-#                + 2*sqrt(Tc**2*V*a**2*m**2*(V - b)**3*(V + b)*(m + 1)**2*(P*R*Tc*V**2
-#                         + P*R*Tc*V*b - P*V*a*m**2 + P*a*b*m**2 + R*Tc*a*m**2
-#                         + 2*R*Tc*a*m + R*Tc*a))*(R*Tc*V**2 + R*Tc*V*b - V*a*m**2
-#                + a*b*m**2)**2)/((R*Tc*V**2 + R*Tc*V*b - V*a*m**2 + a*b*m**2
-#                              )**2*(R**2*Tc**2*V**4 + 2*R**2*Tc**2*V**3*b
-#                              + R**2*Tc**2*V**2*b**2 - 2*R*Tc*V**3*a*m**2
-#                              + 2*R*Tc*V*a*b**2*m**2 + V**2*a**2*m**4
-#                              - 2*V*a**2*b*m**4 + a**2*b**2*m**4))])
         self.no_T_spec = True
         a, b, Tc, m = self.a, self.b, self.Tc, self.m
-        if True:
-            x0 = R*Tc
-            x1 = V*b
-            x2 = x0*x1
-            x3 = V*V
-            x4 = x0*x3
-            x5 = m*m
-            x6 = a*x5
-            x7 = b*x6
-            x8 = V*x6
-            x9 = (x2 + x4 + x7 - x8)**2
-            x10 = x3*x3
-            x11 = R*R*Tc*Tc
-            x12 = a*a
-            x13 = x5*x5
-            x14 = x12*x13
-            x15 = b*b
-            x16 = x3*V
-            x17 = a*x0
-            x18 = x17*x5
-            x19 = 2.*b*x16
-            x20 = -2.*V*b*x14 + 2.*V*x15*x18 + x10*x11 + x11*x15*x3 + x11*x19 + x14*x15 + x14*x3 - 2*x16*x18
-            x21 = V - b
-            x22 = 2*m*x17
-            x23 = P*x4
-            x24 = P*x8
-            x25 = x1*x17
-            x26 = P*R*Tc
-            x27 = x17*x3
-            x28 = V*x12
-            x29 = 2.*m*m*m
-            x30 = b*x12
-            T_calc = -Tc*(2.*a*m*x9*(V*x21*x21*x21*(V + b)*(P*x2 + P*x7 + x17 + x18 + x22 + x23 - x24))**0.5*(m + 1.) - x20*x21*(-P*x16*x6 + x1*x22 + x10*x26 + x13*x28 - x13*x30 + x15*x23 + x15*x24 + x19*x26 + x22*x3 + x25*x5 + x25 + x27*x5 + x27 + x28*x29 + x28*x5 - x29*x30 - x30*x5))/(x20*x9)
-            if abs(T_calc.imag) > 1e-12:
-                raise ValueError("Calculated imaginary temperature %s" %(T_calc))
-            return T_calc
-        else:
-            return Tc*(-2*a*m*sqrt(V*(V - b)**3*(V + b)*(P*R*Tc*V**2 + P*R*Tc*V*b - P*V*a*m**2 + P*a*b*m**2 + R*Tc*a*m**2 + 2*R*Tc*a*m + R*Tc*a))*(m + 1)*(R*Tc*V**2 + R*Tc*V*b - V*a*m**2 + a*b*m**2)**2 + (V - b)*(R**2*Tc**2*V**4 + 2*R**2*Tc**2*V**3*b + R**2*Tc**2*V**2*b**2 - 2*R*Tc*V**3*a*m**2 + 2*R*Tc*V*a*b**2*m**2 + V**2*a**2*m**4 - 2*V*a**2*b*m**4 + a**2*b**2*m**4)*(P*R*Tc*V**4 + 2*P*R*Tc*V**3*b + P*R*Tc*V**2*b**2 - P*V**3*a*m**2 + P*V*a*b**2*m**2 + R*Tc*V**2*a*m**2 + 2*R*Tc*V**2*a*m + R*Tc*V**2*a + R*Tc*V*a*b*m**2 + 2*R*Tc*V*a*b*m + R*Tc*V*a*b + V*a**2*m**4 + 2*V*a**2*m**3 + V*a**2*m**2 - a**2*b*m**4 - 2*a**2*b*m**3 - a**2*b*m**2))/((R*Tc*V**2 + R*Tc*V*b - V*a*m**2 + a*b*m**2)**2*(R**2*Tc**2*V**4 + 2*R**2*Tc**2*V**3*b + R**2*Tc**2*V**2*b**2 - 2*R*Tc*V**3*a*m**2 + 2*R*Tc*V*a*b**2*m**2 + V**2*a**2*m**4 - 2*V*a**2*b*m**4 + a**2*b**2*m**4))
+        x0 = R*Tc
+        x1 = V*b
+        x2 = x0*x1
+        x3 = V*V
+        x4 = x0*x3
+        x5 = m*m
+        x6 = a*x5
+        x7 = b*x6
+        x8 = V*x6
+        x9 = x2 + x4 + x7 - x8
+        x9 *= x9
+        x10 = x3*x3
+        x11 = x0*x0
+        x12 = a*a
+        x13 = x5*x5
+        x14 = x12*x13
+        x15 = b*b
+        x16 = x3*V
+        x17 = a*x0
+        x18 = x17*x5
+        x19 = 2.*b*x16
+        x20 = -2.*V*b*x14 + 2.*V*x15*x18 + x10*x11 + x11*x15*x3 + x11*x19 + x14*x15 + x14*x3 - 2*x16*x18
+        x21 = V - b
+        x22 = 2*m*x17
+        x23 = P*x4
+        x24 = P*x8
+        x25 = x1*x17
+        x26 = P*x0
+        x27 = x17*x3
+        x28 = V*x12
+        x29 = 2.*m*x5
+        x30 = b*x12
+        x31 = V*x21*x21*x21*(V + b)*(P*x2 + P*x7 + x17 + x18 + x22 + x23 - x24)
+        x32 = x20*x21*(-P*x16*x6 + x1*x22 + x10*x26 + x13*x28 - x13*x30 + x15*x23 + x15*x24 + x19*x26 + x22*x3 + x25*x5 + x25 + x27*x5 + x27 + x28*x29 + x28*x5 - x29*x30 - x30*x5)
+        if x31 < 0.0:
+            # Check the sign explicitly rather than taking a complex root
+            T_imag = -Tc*2.*a*m*sqrt(-x31)*(m + 1.)/x20
+            if abs(T_imag) > 1e-12:
+                raise ValueError("Calculated imaginary temperature %s" %(complex(Tc*x32/(x20*x9), T_imag)))
+            x31 = 0.0
+        T_calc = -Tc*(2.*a*m*x9*sqrt(x31)*(m + 1.) - x32)/(x20*x9)
+        return T_calc
 
 class SRKTranslated(SRK):
     r'''Class for solving the volume translated Peng-Robinson equation of state.
@@ -10101,20 +10094,18 @@ class SRKTranslated(SRK):
         self.P = P
         self.V = V
 
-        Pc_inv = 1.0/Pc
-
-        self.a = self.c1*R*R*Tc*Tc*Pc_inv
+        b0 = self.c2R*Tc/Pc
+        self.a = b0*Tc*self.c1R2_c2R
+        self.b = b0 - c
 
         self.c = c
         if alpha_coeffs is None:
-            self.m = 0.480 + 1.574*omega - 0.176*omega*omega
+            self.m = 0.480 + omega*(1.574 - 0.176*omega)
+            self._inv_sqrt_Tc = 1.0/sqrt(Tc)
 
         self.alpha_coeffs = alpha_coeffs
         self.kwargs = {'c': c, 'alpha_coeffs': alpha_coeffs}
 
-        b0 = self.c2*R*Tc*Pc_inv
-        self.b = b0 - c
-
         ### from sympy.abc import V, c, b, epsilon, delta
         ### expand((V+c)*((V+c)+b))
         # delta = (b + 2*c)
@@ -10229,13 +10220,10 @@ class MSRKTranslated(Soave_1979_a_alpha, SRKTranslated):
         self.P = P
         self.V = V
 
-        Pc_inv = 1.0/Pc
-
-        self.a = self.c1*R*R*Tc*Tc*Pc_inv
+        b0 = self.c2R*Tc/Pc
+        self.a = b0*Tc*self.c1R2_c2R
 
         self.c = c
-
-        b0 = self.c2*R*Tc*Pc_inv
         self.b = b0 - c
 
         self.delta = c + c + b0
@@ -10285,7 +10273,9 @@ class MSRKTranslated(Soave_1979_a_alpha, SRKTranslated):
         >>> Eqs = [Eq(alpha0, 1 + (1 - T0/Tc)*(m + n/(T0/Tc))), Eq(alpha1, 1 + (1 - T1/Tc)*(m + n/(T1/Tc)))]  # doctest:+SKIP
         >>> solve(Eqs, [n, m])  # doctest:+SKIP
         '''
-
+        key = (Tc, Pc, omega, c)
+        if key in _MSRK_MN_cache:
+            return _MSRK_MN_cache[key]
 
         SRK_base = SRKTranslated(T=Tc*0.5, P=Pc*0.5, c=c, Tc=Tc, Pc=Pc, omega=omega)
         # Temperatures at 10 mmHg, 760 mmHg
@@ -10295,11 +10285,19 @@ class MSRKTranslated(Soave_1979_a_alpha, SRKTranslated):
 
 
 
-        alpha_10 = SRK_base.a_alpha_and_derivatives(T=T_10, full=False)/SRK_base.a
-        alpha_760 = SRK_base.a_alpha_and_derivatives(T=T_760, full=False)/SRK_base.a
+        a_inv = 1.0/SRK_base.a
+        alpha_10 = SRK_base.a_alpha_pure(T_10)*a_inv
+        alpha_760 = SRK_base.a_alpha_pure(T_760)*a_inv
 
-        N = T_10*T_760*(-(T_10 - Tc)*(alpha_760 - 1) + (T_760 - Tc)*(alpha_10 - 1))/((T_10 - T_760)*(T_10 - Tc)*(T_760 - Tc))
-        M = Tc*(-T_10*(T_760 - Tc)*(alpha_10 - 1) + T_760*(T_10 - Tc)*(alpha_760 - 1))/((T_10 - T_760)*(T_10 - Tc)*(T_760 - Tc))
+        x0 = T_10 - Tc
+        x1 = T_760 - Tc
+        x2 = alpha_10 - 1.0
+        x3 = alpha_760 - 1.0
+        x4 = 1.0/((T_10 - T_760)*x0*x1)
+        N = T_10*T_760*(x1*x2 - x0*x3)*x4
+        M = Tc*(T_760*x0*x3 - T_10*x1*x2)*x4
+        if len(_MSRK_MN_cache) < 1000:
+            _MSRK_MN_cache[key] = (M, N)
         return (M, N)
 
 
@@ -10351,7 +10349,7 @@ class SRKTranslatedPPJP(SRK):
 
     >>> eos = SRKTranslatedPPJP(Tc=507.6, Pc=3025000, omega=0.2975, c=22.3098E-6, T=250., P=1E6)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 0.00011666322408111662, -34158.934132722185, -83.06507748137201)
+    ('l', 0.00011666322408111666, -34158.93413272218, -83.06507748137201)
 
     Notes
     -----
@@ -10376,13 +10374,13 @@ class SRKTranslatedPPJP(SRK):
         self.P = P
         self.V = V
 
-        Pc_inv = 1.0/Pc
-        self.a = self.c1*R2*Tc*Tc*Pc_inv
+        b0 = self.c2R*Tc/Pc
+        self.a = b0*Tc*self.c1R2_c2R
         self.c = c
         self.m = omega*(omega*(0.1223*omega - 0.2963) + 1.5963) + 0.4810
+        self._inv_sqrt_Tc = 1.0/sqrt(Tc)
         self.kwargs = {'c': c}
 
-        b0 = self.c2*R*Tc*Pc_inv
         self.b = b0 - c
         self.delta = c + c + b0
         self.epsilon = c*(b0 + c)
@@ -10456,7 +10454,7 @@ class SRKTranslatedConsistent(Twu91_a_alpha, SRKTranslated):
 
     >>> eos = SRKTranslatedConsistent(Tc=507.6, Pc=3025000, omega=0.2975, T=250., P=1E6)
     >>> eos.phase, eos.V_l, eos.H_dep_l, eos.S_dep_l
-    ('l', 0.00011846802568940222, -34324.05211005662, -83.83861726864234)
+    ('l', 0.00011846802568940224, -34324.05211005661, -83.83861726864234)
 
     Notes
     -----
@@ -10482,32 +10480,61 @@ class SRKTranslatedConsistent(Twu91_a_alpha, SRKTranslated):
         self.T = T
         self.P = P
         self.V = V
-        Pc_inv = 1.0/Pc
-
-        # limit oemga to 0.01 under the eos limit 1.47 for the estimation
-        o = min(max(omega, -0.01), 1.46)
-        if c is None:
-            c = R*Tc*Pc_inv*(0.0172*o + 0.0096)
 
-        if alpha_coeffs is None:
-            L = o*(0.0947*o + 0.6871) + 0.1508
-            M = o*(0.1615*o - 0.2349) + 0.8876
-            N = 2.0
-            alpha_coeffs = (L, M, N)
+        if c is None or alpha_coeffs is None:
+            c_est, alpha_coeffs_est = self.estimate_c_alpha_coeffs(Tc, Pc, omega)
+            if c is None:
+                c = c_est
+            if alpha_coeffs is None:
+                alpha_coeffs = alpha_coeffs_est
 
         self.c = c
         self.alpha_coeffs = alpha_coeffs
         self.kwargs = {'c': c, 'alpha_coeffs': alpha_coeffs}
 
-        self.a = self.c1*R2*Tc*Tc*Pc_inv
-        b0 = self.c2*R*Tc*Pc_inv
-        self.b = b = b0 - c
+        b0 = self.c2R*Tc/Pc
+        self.a = b0*Tc*self.c1R2_c2R
+        self.b = b0 - c
 
         self.delta = c + c + b0
         self.epsilon = c*(b0 + c)
 
         self.solve()
 
+    @staticmethod
+    def estimate_c_alpha_coeffs(Tc, Pc, omega):
+        r'''Estimate the volume translation parameter and the Twu alpha
+        function coefficients of this EOS from the critical properties and
+        acentric factor, using the generalized correlations of [1]_.
+
+        Parameters
+        ----------
+        Tc : float
+            Critical temperature, [K]
+        Pc : float
+            Critical pressure, [Pa]
+        omega : float
+            Acentric factor, [-]
+
+        Returns
+        -------
+        c : float
+            Volume translation parameter, [m^3/mol]
+        alpha_coeffs : tuple(float[3])
+            Coefficients L, M, N of the Twu alpha function, [-]
+
+        Examples
+        --------
+        >>> SRKTranslatedConsistent.estimate_c_alpha_coeffs(Tc=507.6, Pc=3025000, omega=0.2975)
+        (2.05328724522e-05, (0.363593791875, 0.832011009375, 2.0))
+        '''
+        # limit oemga to 0.01 under the eos limit 1.47 for the estimation
+        o = -0.01 if omega < -0.01 else (1.46 if omega > 1.46 else omega)
+        c = R*Tc/Pc*(0.0172*o + 0.0096)
+        L = o*(0.0947*o + 0.6871) + 0.1508
+        M = o*(0.1615*o - 0.2349) + 0.8876
+        return c, (L, M, 2.0)
+
 class APISRK(SRK):
     r'''Class for solving the Refinery Soave-Redlich-Kwong cubic
     equation of state for a pure compound shown in the API Databook [1]_.
@@ -10587,14 +10614,18 @@ class APISRK(SRK):
             raise Exception('Either acentric factor of S1 is required')
 
         if S1 is None:
-            self.S1 = S1 = 0.48508 + 1.55171*omega - 0.15613*omega*omega
+            self.S1 = S1 = 0.48508 + omega*(1.55171 - 0.15613*omega)
         else:
             self.S1 = S1
         self.S2 = S2
+        if S2 == 0:
+            # Reduces to SRK with m = S1; used by solve_T and P_max_at_V
+            self.m = S1
         self.kwargs = {'S1': S1, 'S2': S2}
-        self.a = self.c1*R*R*Tc*Tc/Pc
-        self.b = self.c2*R*Tc/Pc
-        self.delta = self.b
+        self.b = b = self.c2R*Tc/Pc
+        self.a = b*Tc*self.c1R2_c2R
+        self.delta = b
+        self._inv_sqrt_Tc = 1.0/sqrt(Tc)
 
         self.solve()
 
@@ -10629,8 +10660,8 @@ class APISRK(SRK):
         # Development 18, no. 2 (April 1, 1979): 300-306. https://doi.org/10.1021/i260070a022.
         # 1.202*exp(-.30228Tr)
         # Will require CAss in kwargs, is_hydrogen array (or skip vectorized approach)
-        a, Tc, S1, S2 = self.a, self.Tc, self.S1, self.S2
-        x0 = (T/Tc)**0.5
+        a, S1, S2 = self.a, self.S1, self.S2
+        x0 = sqrt(T)*self._inv_sqrt_Tc
         x1 = x0 - 1.
         x2 = x1/x0
         x3 = S2*x2
@@ -10638,14 +10669,18 @@ class APISRK(SRK):
         x5 = S1*x0
         x6 = S2 - x3 + x5
         x7 = 3.*S2
+        T_inv = 1.0/T
         a_alpha = a*x4*x4
-        da_alpha_dT = a*x4*x6/T
-        d2a_alpha_dT2 = a*(-x4*(-x2*x7 + x5 + x7) + x6*x6)/(2.*T*T)
+        da_alpha_dT = a*x4*x6*T_inv
+        d2a_alpha_dT2 = 0.5*a*(-x4*(-x2*x7 + x5 + x7) + x6*x6)*T_inv*T_inv
         return a_alpha, da_alpha_dT, d2a_alpha_dT2
 
     def a_alpha_pure(self, T):
-        a, Tc, S1, S2 = self.a, self.Tc, self.S1, self.S2
-        return a*(S1*(-(T/Tc)**0.5 + 1.) + S2*(-(T/Tc)**0.5 + 1)*(T/Tc)**-0.5 + 1)**2
+        a, S1, S2 = self.a, self.S1, self.S2
+        x0 = sqrt(T)*self._inv_sqrt_Tc
+        x1 = 1.0 - x0
+        x2 = S1*x1 + S2*x1/x0 + 1.0
+        return a*x2*x2
 
     def solve_T(self, P, V, solution=None):
         r'''Method to calculate `T` from a specified `P` and `V` for the API
@@ -10676,31 +10711,68 @@ class APISRK(SRK):
         '''
         self.no_T_spec = True
         if self.S2 == 0:
-            self.m = self.S1
             return SRK.solve_T(self, P, V, solution=solution)
 
         else:
             # Previously coded method is  63 microseconds vs 47 here
 #            return super(SRK, self).solve_T(P, V)
             Tc, a, b, S1, S2 = self.Tc, self.a, self.b, self.S1, self.S2
+            inv_sqrt_Tc = self._inv_sqrt_Tc
             x2 = R/(V-b)
-            x3 = (V*(V + b))
+            x3 = a/(V*(V + b))
             def to_solve(T):
-                x0 = (T/Tc)**0.5
+                x0 = sqrt(T)*inv_sqrt_Tc
                 x1 = x0 - 1.
-                return (x2*T - a*(S1*x1 + S2*x1/x0 - 1.)**2/x3) - P
+                x5 = S2/x0
+                x4 = S1*x1 + x1*x5 - 1.
+                T_inv = 1.0/T
+                x6 = S1*x0
+                # First and second temperature derivatives of x4
+                dx4 = 0.5*(x6 + x5)*T_inv
+                d2x4 = -0.25*(x6 + 3.0*x5)*T_inv*T_inv
+                err = x2*T - x3*x4*x4 - P
+                derr = x2 - 2.0*x3*x4*dx4
+                d2err = -2.0*x3*(dx4*dx4 + x4*d2x4)
+                return err, derr, d2err
 
         if solution is None:
             try:
-                return newton(to_solve, Tc*0.5)
-            except:
+                # With u = sqrt(T/Tc), the residual multiplied by u^2 is a
+                # quartic in u. Squaring the alpha term adds roots where
+                # 1 + S1*(1-u) + S2*(1-u)/u is negative; only the roots
+                # with a positive alpha term are kept, and of those the one
+                # nearest the old Tc/2 starting point is used.
+                k = S2 - S1 - 1.0
+                roots = roots_quartic(Tc*x2 - x3*S1*S1, -2.0*x3*S1*k,
+                                      -P - x3*(k*k - 2.0*S1*S2), 2.0*x3*k*S2,
+                                      -x3*S2*S2)
+                guess = Tc*0.5
+                best = inf
+                for r in roots:
+                    u = r.real
+                    if (abs(r.imag) < 1e-9*abs(u) and u > 0.0
+                        and S1*u*u + k*u - S2 < 0.0):
+                        T_root = Tc*u*u
+                        if abs(T_root - Tc*0.5) < best:
+                            best = abs(T_root - Tc*0.5)
+                            guess = T_root
+                # Halley's method polishes the closed form root
+                return newton(to_solve, guess, fprime=True, fprime2=True)
+            except (UnconvergedError, ValueError, ArithmeticError):
                 pass
+            # Bracketed attempt before the expensive generic solver. The
+            # spurious roots where the alpha term is negative, often at very
+            # high T, are not excluded by the bracket. If the bracket holds
+            # two roots the sign test fails and brenth is skipped.
+            low, high = 0.1*Tc, 10.0*Tc
+            f_low, f_high = to_solve(low)[0], to_solve(high)[0]
+            if f_low*f_high < 0.0:
+                return brenth(lambda T: to_solve(T)[0], low, high, fa=f_low, fb=f_high)
         return GCEOS.solve_T(self, P, V, solution=solution)
 
 
     def P_max_at_V(self, V):
         if self.S2 == 0:
-            self.m = self.S1
             return SRK.P_max_at_V(self, V)
         return GCEOS.P_max_at_V(self, V)
 
@@ -10789,10 +10861,10 @@ class TWUPR(TwuPR95_a_alpha, PR):
         self.T = T
         self.P = P
         self.V = V
-        self.a = self.c1*R*R*Tc*Tc/Pc
-        self.b = self.c2*R*Tc/Pc
-        self.delta = 2.*self.b
-        self.epsilon = -self.b*self.b
+        self.b = b = self.c2R*Tc/Pc
+        self.a = b*Tc*self.c1R2_c2R
+        self.delta = 2.*b
+        self.epsilon = -b*b
         self.check_sufficient_inputs()
 
         self.solve()
@@ -10883,9 +10955,9 @@ class TWUSRK(TwuSRK95_a_alpha, SRK):
         self.P = P
         self.V = V
 
-        self.a = self.c1*R*R*Tc*Tc/Pc
-        self.b = self.c2*R*Tc/Pc
-        self.delta = self.b
+        self.b = b = self.c2R*Tc/Pc
+        self.a = b*Tc*self.c1R2_c2R
+        self.delta = b
         self.check_sufficient_inputs()
         self.solve()
 
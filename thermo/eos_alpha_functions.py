@@ -1244,9 +1244,11 @@ def TWU_a_alpha_common(T, Tc, omega, a, full=True, method='PR'):
         x27 = x10*x16*x26
         x28 = M1**2
         x29 = L1*x10*x12*x16*x26
-        a_alpha = a*(-omega*(-x10*exp(L1*(-x12 + 1)) + x3*exp(L0*(-x5 + 1))) + x7)
-        da_alpha_dT = a*(omega*x17 + x15)/T
-        d2a_alpha_dT2 = a*(-(omega*(-L1**2*x0**(2.*x11)*x27*x28 + 2.*M1*x29*x8 + x17 + x20 - x23 - x24 + x25 - x27*x8**2 + x28*x29) + x15 - x20 + x23 + x24 - x25)/T**2)
+        T_inv = 1.0/T
+        # x6 and x16 are already the two exponential terms
+        a_alpha = a*(-omega*(-x10*x16 + x7) + x7)
+        da_alpha_dT = a*(omega*x17 + x15)*T_inv
+        d2a_alpha_dT2 = a*(-(omega*(-L1*L1*x12*x12*x27*x28 + 2.*M1*x29*x8 + x17 + x20 - x23 - x24 + x25 - x27*x8*x8 + x28*x29) + x15 - x20 + x23 + x24 - x25)*T_inv*T_inv)
         if a_alpha < min_a_alpha:
             a_alpha = min_a_alpha
             da_alpha_dT = d2a_alpha_dT2 = 0.0
@@ -1607,7 +1609,7 @@ class Mathias_Copeman_poly_a_alpha(a_alpha_base):
         ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
         a_alphas = []
         for i in range(self.N):
-            tau = 1.0 - (T/Tcs[i])**0.5
+            tau = 1.0 - sqrt(T/Tcs[i])
             if T < Tcs[i]:
                 x0 = horner(alpha_coeffs[i], tau)
                 a_alpha = x0*x0*ais[i]
@@ -1623,7 +1625,7 @@ class Mathias_Copeman_poly_a_alpha(a_alpha_base):
         for i in range(self.N):
             a = ais[i]
             Tc = Tcs[i]
-            rt = (T/Tc)**0.5
+            rt = sqrt(T/Tc)
             tau = 1.0 - rt
             if T < Tc:
                 x0, x1, x2 = horner_and_der2(alpha_coeffs[i], tau)
@@ -1666,7 +1668,7 @@ class Mathias_Copeman_poly_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         Tc = self.Tc
         a = self.a
-        rt = (T/Tc)**0.5
+        rt = sqrt(T/Tc)
         tau = 1.0 - rt
         alpha_coeffs = self.alpha_coeffs
         if T < Tc:
@@ -230,6 +230,7 @@ from thermo.eos_alpha_functions import (TwuPR95_a_alpha, TwuSRK95_a_alpha, Twu91
                                         PRSV2_a_alphas_vectorized, PRSV2_a_alpha_and_derivatives_vectorized,
                                         APISRK_a_alphas_vectorized, APISRK_a_alpha_and_derivatives_vectorized)
 from thermo.eos import *
+from thermo.eos import _SRK_P_max_at_V
 
 try:
     (zeros, array, npexp, npsqrt, empty, full, npwhere, npmin, npmax) = (
@@ -1192,43 +1193,37 @@ class GCEOSMIX(GCEOS):
 
 
     def a_alpha_and_derivatives_numpy(self, a_alphas, da_alpha_dTs, d2a_alpha_dT2s, T, full=True, quick=True):
-        zs, kijs = self.zs, np.array(self.kijs)
+        zs, one_minus_kijs = np.array(self.zs), 1.0 - np.array(self.kijs)
         a_alphas = np.array(a_alphas)
-        da_alpha_dTs = np.array(da_alpha_dTs)
-        one_minus_kijs = 1.0 - kijs
-
-        x0 = np.einsum('i,j', a_alphas, a_alphas)
-        x0_05 = npsqrt(x0)
-        a_alpha_ijs = (one_minus_kijs)*x0_05
-        z_products = np.einsum('i,j', zs, zs)
-        a_alpha = np.einsum('ij,ji', a_alpha_ijs, z_products)
-        
-        if self.scalar:
-            self.a_alpha_ijs = a_alpha_ijs.tolist()
-        else:
-            self.a_alpha_ijs = a_alpha_ijs
-
-        if full:
-            term0 = np.einsum('j,i', a_alphas, da_alpha_dTs)
-            term7 = (one_minus_kijs)/(x0_05)
-            da_alpha_dT = (z_products*term7*(term0)).sum()
-
-            term1 = -x0_05/x0*(one_minus_kijs)
+        self.a_alpha_roots = a_alpha_roots = npsqrt(a_alphas)
 
-            term2 = np.einsum('i, j', a_alphas, da_alpha_dTs)
+        # N square roots instead of N^2; the double sums are matrix-vector
+        # products, which also give the row sums needed for fugacities
+        x0_05 = np.outer(a_alpha_roots, a_alpha_roots)
+        a_alpha_j_rows = np.dot(one_minus_kijs*x0_05, zs)
+        a_alpha = float(np.dot(zs, a_alpha_j_rows))
+        self.a_alpha_j_rows = a_alpha_j_rows.tolist() if self.scalar else a_alpha_j_rows
 
-            main3 = da_alpha_dTs/(2.0*a_alphas)*term2
-            main4 = -np.einsum('i, j', a_alphas, d2a_alpha_dT2s)
-            main6 = -0.5*np.einsum('i, j', da_alpha_dTs, da_alpha_dTs)
+        if full:
+            da_alpha_dTs = np.array(da_alpha_dTs)
+            d2a_alpha_dT2s = np.array(d2a_alpha_dT2s)
+            x0 = np.outer(a_alphas, a_alphas)
+            term0 = np.outer(a_alphas, da_alpha_dTs)
+            term7 = one_minus_kijs/x0_05
 
             # Needed for fugacity temperature derivative
-            self.da_alpha_dT_ijs = (0.5*(term7)*(term2 + term0)).tolist()
-
-            d2a_alpha_dT2 = (z_products*(term1*(main3 + main4 + main6))).sum()
-
-            return float(a_alpha), float(da_alpha_dT), float(d2a_alpha_dT2)
+            da_alpha_dT_j_rows = np.dot(0.5*term7*(term0 + term0.T), zs)
+            da_alpha_dT = float(np.dot(zs, da_alpha_dT_j_rows))
+            self.da_alpha_dT_j_rows = da_alpha_dT_j_rows.tolist() if self.scalar else da_alpha_dT_j_rows
+
+            term1 = -x0_05/x0*one_minus_kijs
+            main3 = da_alpha_dTs/(2.0*a_alphas)*term0
+            main4 = -np.outer(a_alphas, d2a_alpha_dT2s)
+            main6 = -0.5*np.outer(da_alpha_dTs, da_alpha_dTs)
+            d2a_alpha_dT2 = float(np.dot(zs, np.dot(term1*(main3 + main4 + main6), zs)))
+            return a_alpha, da_alpha_dT, d2a_alpha_dT2
         else:
-            return float(a_alpha)
+            return a_alpha
 
     def _spinodal_f(self, TPV):
         # TODO - use `self`, do not create new instance
@@ -8992,6 +8987,10 @@ class SRKMIX(EpsilonZeroMixingRules, GCEOSMIX, SRK):
             d_lnphi_dPs.append(d_lnphi_dP)
         return d_lnphi_dPs
 
+    def P_max_at_V(self, V):
+        # Same as SRK.P_max_at_V, evaluated for the first component
+        return _SRK_P_max_at_V(self.Tcs[0], self.ais[0], self.ms[0], self.bs[0], V)
+
 
 class SRKMIXTranslated(SRKMIX):
     r'''Class for solving the volume translated Soave-Redlich-Kwong cubic equation of state for a
@@ -9528,20 +9527,17 @@ class SRKMIXTranslatedConsistent(Twu91_a_alpha, SRKMIXTranslated):
             b0s = c2R*Tcs/Pcs
             self.ais = c1R2_c2R*Tcs*b0s
 
+        if alpha_coeffs is None or (cs is None and scalar):
+            estimates = [SRKTranslatedConsistent.estimate_c_alpha_coeffs(Tcs[i], Pcs[i], omegas[i])
+                         for i in range(N)]
         if cs is None:
             if scalar:
-                cs = [R*Tcs[i]/Pcs[i]*(0.0172*min(max(omegas[i], -0.01), 1.46) + 0.0096)
-                    for i in range(N)]
+                cs = [estimates[i][0] for i in range(N)]
             else:
                 cs = R*Tcs/Pcs*(0.0172*npmin(npmax(omegas, -0.01), 1.46) + 0.0096)
-                
+
         if alpha_coeffs is None:
-            alpha_coeffs = []
-            for i in range(N):
-                o = min(max(omegas[i], -0.01), 1.46)
-                L = o*(0.0947*o + 0.6871) + 0.1508
-                M = o*(0.1615*o - 0.2349) + 0.8876
-                alpha_coeffs.append((L, M, 2.0))
+            alpha_coeffs = [estimates[i][1] for i in range(N)]
 
         self.kwargs = {'kijs': kijs, 'alpha_coeffs': alpha_coeffs, 'cs': cs}
         self.alpha_coeffs = alpha_coeffs
@@ -11542,10 +11538,8 @@ class APISRKMIX(SRKMIX, APISRK):
 
     def P_max_at_V(self, V):
         if self.N == 1 and self.S2s[0] == 0:
-            self.ms = self.S1s
-            P_max_at_V = SRK.P_max_at_V(self, V)
-            del self.ms
-            return P_max_at_V
+            # Same as SRK.P_max_at_V with m = S1
+            return _SRK_P_max_at_V(self.Tcs[0], self.ais[0], self.S1s[0], self.bs[0], V)
         return GCEOSMIX.P_max_at_V(self, V)
 
 
@@ -25,12 +25,16 @@ from __future__ import division
 __all__ = ['TDependentProperty',]
 
 import os
+from sys import intern
+from bisect import bisect_left, bisect_right
+from functools import partial
 try:
     from random import uniform
 except: # pragma: no cover
     pass
 from fluids.numerics import (quad, brenth, secant, linspace, 
                              polyint, polyint_over_x, derivative, 
+                             central_diff_weights, 
                              polyder, horner, numpy as np, curve_fit, 
                              differential_evolution, fit_minimization_targets, 
                              leastsq)
@@ -50,7 +54,8 @@ from chemicals.vapor_pressure import (Antoine, Antoine_AB_coeffs_from_point,
                                       d2TRC_Antoine_extended_dT2, 
                                       Wagner_fitting_jacobian, 
                                       Wagner_original_fitting_jacobian, 
-                                      Antoine_fitting_jacobian)
+                                      Antoine_fitting_jacobian, 
+                                      TRC_Antoine_extended_fitting_jacobian)
 from chemicals.dippr import EQ100, EQ101, EQ102, EQ104, EQ105, EQ106, EQ107, EQ114, EQ115, EQ116, EQ127, EQ102_fitting_jacobian, EQ101_fitting_jacobian, EQ106_fitting_jacobian, EQ105_fitting_jacobian, EQ107_fitting_jacobian
 from chemicals.phase_change import Watson, Watson_n, Alibakhshi, PPDS12
 from chemicals.viscosity import (Viswanath_Natarajan_2, Viswanath_Natarajan_2_exponential,
@@ -78,11 +83,113 @@ from thermo.eos_alpha_functions import (Twu91_alpha_pure, Soave_1979_alpha_pure,
 from thermo.eos import GCEOS
 from thermo.coolprop import coolprop_fluids
 from thermo.fitting import data_fit_statistics
-from math import inf
+from math import inf, nan, log1p
 import thermo
 from thermo.utils import VDI_TABULAR, POLY_FIT, has_matplotlib
+from thermo.base import source_path
 
 
+_fitting_function_cache = {}
+
+_correlation_derivative_calls = {1: 'f_der', 2: 'f_der2', 3: 'f_der3'}
+
+def _resolve_fitting_function(model, jac, try_numba):
+    name = model + '_fitting_jacobian' if jac else model
+    for mod in (chemicals, thermo):
+        # Try to find the fitting function in thermo and chemicals
+        # most are in chemicals so we try it first
+        if try_numba:
+            # Reasons to write a custom accelerating wrapper:
+            # 1) ufuncs with numba are 1.5-2x slower than expected
+            # 2) optional arguments are not supported, which is an issue for many
+            # models which default to zero coefficients
+            try:
+                # The numba modules compile on first attribute access, which
+                # fails when numba is not installed
+                f = getattr(mod.numba if jac else mod.numba_vectorized, name, None)
+            except:
+                f = None
+            if f is not None:
+                return f
+        f = getattr(mod if jac else mod.vectorized, name, None)
+        if f is not None:
+            return f
+    raise ValueError("Could not find a fitting function for model %s" %(model,))
+
+class _FittingFunction:
+    __slots__ = ('f', 'reusable_args', 'arg_dest_idxs')
+
+    def __init__(self, f, reusable_args, arg_dest_idxs):
+        self.f = f
+        self.reusable_args = reusable_args
+        self.arg_dest_idxs = arg_dest_idxs
+
+    def __call__(self, Ts, *args):
+        reusable_args = self.reusable_args
+        for i, v in zip(self.arg_dest_idxs, args):
+            reusable_args[i] = v
+        return self.f(Ts, *reusable_args)
+
+class _SkipColumnsFittingFunction:
+    __slots__ = ('f', 'reusable_args', 'arg_dest_idxs', 'keep_idxs')
+
+    def __init__(self, f, reusable_args, arg_dest_idxs, keep_idxs):
+        self.f = f
+        self.reusable_args = reusable_args
+        self.arg_dest_idxs = arg_dest_idxs
+        self.keep_idxs = keep_idxs
+
+    def __call__(self, Ts, *args):
+        reusable_args = self.reusable_args
+        for i, v in zip(self.arg_dest_idxs, args):
+            reusable_args[i] = v
+        return np.take(self.f(Ts, *reusable_args), self.keep_idxs, axis=1)
+
+class _LinearInterpolator:
+    # Scalar linear interpolation with linear extrapolation off either end;
+    # same arithmetic as interp1d(fill_value='extrapolate') without its
+    # per-call overhead
+    __slots__ = ('x', 'y', 'slopes', 'i_max')
+
+    def __init__(self, x, y):
+        if len(x) < 2:
+            raise ValueError("At least two points are required for interpolation")
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.slopes = ((y[1:] - y[:-1])/(x[1:] - x[:-1])).tolist()
+        self.x = x.tolist()
+        self.y = y.tolist()
+        self.i_max = len(self.x) - 1
+
+    def __call__(self, x):
+        i = bisect_left(self.x, x)
+        if i < 1:
+            i = 1
+        elif i > self.i_max:
+            i = self.i_max
+        i -= 1
+        return self.slopes[i]*(x - self.x[i]) + self.y[i]
+
+class _CubicSplineEvaluator:
+    # Scalar evaluator for the pieces of a scipy CubicSpline; much cheaper
+    # per call than going through interp1d or PPoly
+    __slots__ = ('x', 'coeffs', 'i_max')
+
+    def __init__(self, spline):
+        self.x = spline.x.tolist()
+        self.coeffs = spline.c.T.tolist()
+        self.i_max = len(self.x) - 2
+
+    def __call__(self, x):
+        xs = self.x
+        i = bisect_right(xs, x) - 1
+        if i < 0:
+            i = 0
+        elif i > self.i_max:
+            i = self.i_max
+        c0, c1, c2, c3 = self.coeffs[i]
+        dx = x - xs[i]
+        return ((c0*dx + c1)*dx + c2)*dx + c3
+
 def generate_fitting_function(model,
                               param_order,
                               fit_parameters,
@@ -95,34 +202,12 @@ def generate_fitting_function(model,
     consumption by curve_fit. Other minimizers will require a different
     objective function.
     '''
-    if jac:
-        model_jac_name = model + '_fitting_jacobian'
-    for mod in (chemicals, thermo):
-        # Try to find the fitting function in thermo and chemicals
-        # most are in chemicals so we try it first
-        try:
-            if try_numba:
-                # Reasons to write a custom accelerating wrapper:
-                # 1) ufuncs with numba are 1.5-2x slower than expected
-                # 2) optional arguments are not supported, which is an issue for many
-                # models which default to zero coefficients
-                try:
-                    if jac:
-                        f = getattr(mod.numba, model_jac_name)
-                    else:
-                        f = getattr(mod.numba_vectorized, model)
-                except:
-                    if jac:
-                        f = getattr(mod, model_jac_name)
-                    else:
-                        f = getattr(mod.vectorized, model)
-            else:
-                if jac:
-                    f = getattr(mod, model_jac_name)
-                else:
-                    f = getattr(mod.vectorized, model)
-        except:
-            pass
+    cache_key = (model, jac, try_numba)
+    try:
+        f = _fitting_function_cache[cache_key]
+    except KeyError:
+        f = _resolve_fitting_function(model, jac, try_numba)
+        _fitting_function_cache[cache_key] = f
 
     # arg_dest_idxs is a list of indexes for each parameter
     # to be transformed into the output array
@@ -145,30 +230,36 @@ def generate_fitting_function(model,
         # Handle the DIPPR equations that have the DIPPR equation in them
         reusable_args.append(0)
     if jac:
-        jac_skip_row_idxs = []
+        jac_keep_row_idxs = []
         for i, k in enumerate(all_fit_parameters):
-            if k not in fit_parameters:
-                jac_skip_row_idxs.append(i)
-        if jac_skip_row_idxs:
-            jac_skip_row_idxs = np.array(jac_skip_row_idxs)
-            #for k in fit_parameters:
-            def fitting_function(Ts, *args):
-                for i, v in enumerate(args):
-                    reusable_args[arg_dest_idxs[i]] = v
-                out = f(Ts, *reusable_args)
-                return np.delete(out, jac_skip_row_idxs, axis=1)
-        else:
-            def fitting_function(Ts, *args):
-                for i, v in enumerate(args):
-                    reusable_args[arg_dest_idxs[i]] = v
-                return f(Ts, *reusable_args)
-    else:
-        def fitting_function(Ts, *args):
-            ld = arg_dest_idxs
-            for i, v in enumerate(args):
-                reusable_args[ld[i]] = v
-            return f(Ts, *reusable_args)
-    return fitting_function
+            if k in fit_parameters:
+                jac_keep_row_idxs.append(i)
+        if len(jac_keep_row_idxs) != len(all_fit_parameters):
+            # Selecting the kept columns once is cheaper than np.delete,
+            # which rebuilds a mask on every jacobian evaluation
+            return _SkipColumnsFittingFunction(f, reusable_args, arg_dest_idxs,
+                                               np.array(jac_keep_row_idxs))
+    return _FittingFunction(f, reusable_args, arg_dest_idxs)
+
+def _DIPPR_integral_calls(f):
+    # DIPPR equations which implement the first derivative and both integrals
+    return {'f': f, 'f_der': partial(f, order=1), 'f_int': partial(f, order=-1),
+            'f_int_over_T': partial(f, order=-1j)}
+
+def _DIPPR_derivative_calls(f):
+    # DIPPR equations which implement the first three derivatives
+    return {'f': f, 'f_der': partial(f, order=1), 'f_der2': partial(f, order=2),
+            'f_der3': partial(f, order=3)}
+
+def _fit_export_polynomial(cls, CAS, method, n, start_n, max_n, eval_pts):
+    # Module level so it can be pickled for TDependentProperty._fit_export_polynomials
+    print(CAS)
+    obj = cls(CASRN=CAS)
+    coeffs, (low, high), stats = obj.fit_polynomial(method, n=n, start_n=start_n, max_n=max_n, eval_pts=eval_pts)
+    max_error = max(abs(1.0 - stats[2]), abs(1.0 - stats[3]))
+    return {'Tmax': high, 'Tmin': low, 'error_average': stats[0],
+            'error_std': stats[1], 'max_error': max_error , 'method': method,
+            'coefficients': coeffs}
 
 def create_local_method(f, f_der, f_der2, f_der3, f_int, f_int_over_T):
     if callable(f):
@@ -201,23 +292,36 @@ class ConstantLocalMethod:
     def __init__(self, value):
         self.value = value
         
+    # Array inputs of T are supported so a temperature grid can be
+    # evaluated in a single call
     def f(self, T):
+        if isinstance(T, np.ndarray):
+            return np.full(T.shape, self.value, dtype=float)
         return self.value
       
     def f_der(self, T):
+        if isinstance(T, np.ndarray):
+            return np.zeros(T.shape)
         return 0.
     
     def f_der2(self, T):
+        if isinstance(T, np.ndarray):
+            return np.zeros(T.shape)
         return 0.
     
     def f_der3(self, T):
+        if isinstance(T, np.ndarray):
+            return np.zeros(T.shape)
         return 0.
         
     def f_int(self, Ta, Tb):
         return self.value * (Tb - Ta)
 
     def f_int_over_T(self, Ta, Tb):
-        return self.value * log(Tb/Ta)
+        if isinstance(Ta, np.ndarray) or isinstance(Tb, np.ndarray):
+            return self.value * np.log(Tb/Ta)
+        # log1p keeps full precision over the short intervals used in quadrature
+        return self.value * log1p((Tb - Ta)/Ta)
 
 
 class TDependentProperty(object):
@@ -406,6 +510,7 @@ class TDependentProperty(object):
         'TRC_Antoine_extended': (['Tc', 'to', 'A', 'B', 'C', 'n', 'E', 'F'], [],
                                  {'f': TRC_Antoine_extended, 'f_der': dTRC_Antoine_extended_dT, 'f_der2': d2TRC_Antoine_extended_dT2},
                                  {'fit_params': ['to', 'A', 'B', 'C', 'n', 'E', 'F'],
+                                  'fit_jac': TRC_Antoine_extended_fitting_jacobian,
                                   'initial_guesses': [
                                       {'to': 3.0, 'A': 8.9, 'B': 933., 'C': -33., 'n': 2.25, 'E': -55., 'F': 3300.0},
                                       {'to': -76.0, 'A': 8.9, 'B': 650., 'C': -23., 'n': 2.5, 'E': 63.0, 'F': -2130.},
@@ -526,10 +631,7 @@ class TDependentProperty(object):
     # Plain polynomial
     'DIPPR100': ([],
       ['A', 'B', 'C', 'D', 'E', 'F', 'G'],
-      {'f': EQ100,
-       'f_der': lambda T, **kwargs: EQ100(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ100(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ100(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ100),
       {'fit_params': ['A', 'B', 'C', 'D', 'E', 'F', 'G'],
        'initial_guesses': [
            {'A': 1.0, 'B': 0.0, 'C': 0.0, 'D': 0.0, 'E': 0.0, 'F': 0.0, 'G': 0.0},
@@ -542,50 +644,32 @@ class TDependentProperty(object):
       ),
     'constant': ([],
       ['A'],
-      {'f': EQ100,
-       'f_der': lambda T, **kwargs: EQ100(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ100(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ100(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ100),
       {'fit_params': ['A']},
       ),
     'linear': ([],
       ['A', 'B'],
-      {'f': EQ100,
-       'f_der': lambda T, **kwargs: EQ100(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ100(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ100(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ100),
       {'fit_params': ['A', 'B']},
       ),
     'quadratic': ([],
       ['A', 'B', 'C'],
-      {'f': EQ100,
-       'f_der': lambda T, **kwargs: EQ100(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ100(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ100(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ100),
       {'fit_params': ['A', 'B', 'C']},
       ),
     'cubic': ([],
       ['A', 'B', 'C', 'D'],
-      {'f': EQ100,
-       'f_der': lambda T, **kwargs: EQ100(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ100(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ100(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ100),
       {'fit_params': ['A', 'B', 'C', 'D']},
       ),
     'quintic': ([],
       ['A', 'B', 'C', 'D', 'E'],
-      {'f': EQ100,
-       'f_der': lambda T, **kwargs: EQ100(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ100(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ100(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ100),
       {'fit_params': ['A', 'B', 'C', 'D', 'E']},
       ),
      'DIPPR101': (['A', 'B'],
       ['C', 'D', 'E'],
-      {'f': EQ101,
-       'f_der': lambda T, **kwargs: EQ101(T, order=1, **kwargs),
-       'f_der2': lambda T, **kwargs: EQ101(T, order=2, **kwargs),
-       'f_der3': lambda T, **kwargs: EQ101(T, order=3, **kwargs)},
+      _DIPPR_derivative_calls(EQ101),
       {'fit_params': ['A', 'B', 'C', 'D', 'E'],
       'fit_jac': EQ101_fitting_jacobian,
        'initial_guesses': [
@@ -728,10 +812,7 @@ class TDependentProperty(object):
       ),
      'DIPPR102': (['A', 'B', 'C', 'D'],
       [],
-      {'f': EQ102,
-       'f_der': lambda T, **kwargs: EQ102(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ102(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ102(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ102),
      {'fit_params': ['A', 'B', 'C', 'D'],
       'fit_jac': EQ102_fitting_jacobian,
       'initial_guesses': [
@@ -772,10 +853,7 @@ class TDependentProperty(object):
         ]}),
      'DIPPR104': (['A', 'B'],
       ['C', 'D', 'E'],
-      {'f': EQ104,
-       'f_der': lambda T, **kwargs: EQ104(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ104(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ104(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ104),
       
       
      {'fit_params': ['A', 'B', 'C', 'D', 'E'], 'initial_guesses': [
@@ -787,10 +865,7 @@ class TDependentProperty(object):
      
      'DIPPR105': (['A', 'B', 'C', 'D'],
       [],
-      {'f': EQ105,
-       'f_der': lambda T, **kwargs: EQ105(T, order=1, **kwargs),
-       'f_der2': lambda T, **kwargs: EQ105(T, order=2, **kwargs),
-       'f_der3': lambda T, **kwargs: EQ105(T, order=3, **kwargs)},
+      _DIPPR_derivative_calls(EQ105),
       {'fit_params': ['A', 'B', 'C', 'D'],'fit_jac': EQ105_fitting_jacobian,
        'initial_guesses': [
           {'A': 500.0, 'B': 0.25, 'C': 630.0, 'D': 0.22,}, # near 2-Octanol dippr volume
@@ -844,10 +919,7 @@ class TDependentProperty(object):
 
      'DIPPR106': (['Tc', 'A', 'B'],
       ['C', 'D', 'E'],
-      {'f': EQ106,
-       'f_der': lambda T, **kwargs: EQ106(T, order=1, **kwargs),
-       'f_der2': lambda T, **kwargs: EQ106(T, order=2, **kwargs),
-       'f_der3': lambda T, **kwargs: EQ106(T, order=3, **kwargs)},
+      _DIPPR_derivative_calls(EQ106),
      {'fit_params': ['A', 'B', 'C', 'D', 'E'], 'fit_jac': EQ106_fitting_jacobian,
       'initial_guesses': [
           {'A': 47700.0, 'B': 0.37, 'C': 0.,'D': 0.0, 'E': 0.0},  # near vinyl acetate dippr Hvap
@@ -867,18 +939,12 @@ class TDependentProperty(object):
       }),
      'YawsSigma': (['Tc', 'A', 'B'],
       ['C', 'D', 'E'],
-      {'f': EQ106,
-       'f_der': lambda T, **kwargs: EQ106(T, order=1, **kwargs),
-       'f_der2': lambda T, **kwargs: EQ106(T, order=2, **kwargs),
-       'f_der3': lambda T, **kwargs: EQ106(T, order=3, **kwargs)},
+      _DIPPR_derivative_calls(EQ106),
       {'fit_params': ['A', 'B']}),
 
      'DIPPR107': ([],
       ['A', 'B', 'C', 'D', 'E'],
-      {'f': EQ107,
-       'f_der': lambda T, **kwargs: EQ107(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ107(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ107(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ107),
       {'fit_params': ['A', 'B', 'C', 'D', 'E'],
        'fit_jac': EQ107_fitting_jacobian,
        'initial_guesses':[
@@ -902,10 +968,7 @@ class TDependentProperty(object):
       # 
      'DIPPR114': (['Tc', 'A', 'B', 'C', 'D'],
       [],
-      {'f': EQ114,
-       'f_der': lambda T, **kwargs: EQ114(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ114(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ114(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ114),
      {'fit_params': ['A', 'B', 'C', 'D'], 'initial_guesses': [
           {'A': 65.0, 'B': 30000, 'C': -850, 'D': 2000.0},
           {'A': 150.0, 'B': -45000, 'C': -2500, 'D': 6000.0},
@@ -914,27 +977,18 @@ class TDependentProperty(object):
      
      'DIPPR115': (['A', 'B'],
       ['C', 'D', 'E'],
-      {'f': EQ115,
-       'f_der': lambda T, **kwargs: EQ115(T, order=1, **kwargs),
-       'f_der2': lambda T, **kwargs: EQ115(T, order=2, **kwargs),
-       'f_der3': lambda T, **kwargs: EQ115(T, order=3, **kwargs)},
+      _DIPPR_derivative_calls(EQ115),
       {'fit_params': ['A', 'B', 'C', 'D', 'E'],
        'initial_guesses': [
            {'A': 38.0, 'B': -9100, 'C': 0.16, 'D': -8.3e-7, 'E': 0.0},
            ]}),
      'DIPPR116': (['Tc', 'A', 'B', 'C', 'D', 'E'],
       [],
-      {'f': EQ116,
-       'f_der': lambda T, **kwargs: EQ116(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ116(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ116(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ116),
       {'fit_params': ['A', 'B', 'C', 'D', 'E']}),
      'DIPPR127': (['A', 'B', 'C', 'D', 'E', 'F', 'G'],
       [],
-      {'f': EQ127,
-       'f_der': lambda T, **kwargs: EQ127(T, order=1, **kwargs),
-       'f_int': lambda T, **kwargs: EQ127(T, order=-1, **kwargs),
-       'f_int_over_T': lambda T, **kwargs: EQ127(T, order=-1j, **kwargs)},
+      _DIPPR_integral_calls(EQ127),
       {'fit_params': ['A', 'B', 'C', 'D', 'E', 'F', 'G'], 'initial_guesses': [
           {'A': 35000.0, 'B': 1e8, 'C': -3e3, 'D': 5e5, 'E': -500.0, 'F': 7.5e7, 'G': -2500.0},
           {'A': 35000.0, 'B': 1e5, 'C': -7.5e3, 'D': 2e5, 'E': -800.0, 'F': 2e5, 'G': -2500.0},
@@ -1028,7 +1082,7 @@ class TDependentProperty(object):
 
     available_correlations = frozenset(correlation_models.keys())
 
-    correlation_parameters = {k: k + '_parameters' for k in correlation_models.keys()}
+    correlation_parameters = {k: intern(k + '_parameters') for k in correlation_models.keys()}
 
 
 
@@ -1046,19 +1100,10 @@ class TDependentProperty(object):
                          'TP_cached', 'tabular_data_interpolators',
                          'tabular_data_interpolators_P', 'T_cached')
     def __hash__(self):
-        d = self.__dict__
         # extrapolation values and interpolation objects should be ignored
-        temp_store = {}
-        for k in self.hash_ignore_props:
-            try:
-                temp_store[k] = d[k]
-                del d[k]
-            except:
-                pass
-        ans = hash_any_primitive((self.__class__, d))
-        d.update(temp_store)
-
-        return ans
+        ignore = self.hash_ignore_props
+        d = {k: v for k, v in self.__dict__.items() if k not in ignore}
+        return hash_any_primitive((self.__class__, d))
 
     def __repr__(self):
         r'''Create and return a string representation of the object. The design
@@ -1072,43 +1117,40 @@ class TDependentProperty(object):
             String representation, [-]
         '''
         clsname = self.__class__.__name__
-        base = '%s(' % (clsname)
+        parts = []
         if self.CASRN:
-            base += 'CASRN="%s", ' %(self.CASRN)
+            parts.append('CASRN="%s"' %(self.CASRN))
         for k in self.custom_args:
             v = getattr(self, k)
             if v is not None:
-                base += '%s=%s, ' %(k, v)
+                parts.append('%s=%s' %(k, v))
 
         extrap_str = '"%s"' %(self.extrapolation) if self.extrapolation is not None else 'None'
-        base += 'extrapolation=%s, ' %(extrap_str)
+        parts.append('extrapolation=%s' %(extrap_str))
 
         method_str = '"%s"' %(self.method) if self.method is not None else 'None'
-        base += 'method=%s, ' %(method_str)
+        parts.append('method=%s' %(method_str))
         if self.tabular_data:
             if not (len(self.tabular_data) == 1 and VDI_TABULAR in self.tabular_data):
-                base += 'tabular_data=%s, ' %(self.tabular_data)
+                parts.append('tabular_data=%s' %(self.tabular_data))
 
         if self.P_dependent:
             method_P_str = '"%s"' %(self.method_P) if self.method_P is not None else 'None'
-            base += 'method_P=%s, ' %(method_P_str)
+            parts.append('method_P=%s' %(method_P_str))
             if self.tabular_data_P:
-                base += 'tabular_data_P=%s, ' %(self.tabular_data_P)
+                parts.append('tabular_data_P=%s' %(self.tabular_data_P))
             if 'tabular_extrapolation_permitted' in self.__dict__:
-                base += 'tabular_extrapolation_permitted=%s, ' %(self.tabular_extrapolation_permitted)
+                parts.append('tabular_extrapolation_permitted=%s' %(self.tabular_extrapolation_permitted))
 
 
         if hasattr(self, 'poly_fit_Tmin') and self.poly_fit_Tmin is not None:
-            base += 'poly_fit=(%s, %s, %s), ' %(self.poly_fit_Tmin, self.poly_fit_Tmax, self.poly_fit_coeffs)
+            parts.append('poly_fit=(%s, %s, %s)' %(self.poly_fit_Tmin, self.poly_fit_Tmax, self.poly_fit_coeffs))
         for k in self.correlation_parameters.values():
             extra_model = getattr(self, k, None)
             if extra_model:
-                base += '%s=%s, ' %(k, extra_model)
+                parts.append('%s=%s' %(k, extra_model))
 
-
-        if base[-2:] == ', ':
-            base = base[:-2]
-        return base + ')'
+        return '%s(%s)' %(clsname, ', '.join(parts))
 
     def __call__(self, T):
         r'''Convenience method to calculate the property; calls
@@ -1129,10 +1171,9 @@ class TDependentProperty(object):
         '''
         if T == self.T_cached:
             return self.prop_cached
-        else:
-            self.prop_cached = self.T_dependent_property(T)
-            self.T_cached = T
-            return self.prop_cached
+        self.prop_cached = prop = self.T_dependent_property(T)
+        self.T_cached = T
+        return prop
 
     def as_json(self, references=1):
         r'''Method to create a JSON serialization of the property model
@@ -1155,31 +1196,27 @@ class TDependentProperty(object):
         --------
         '''
         # vaguely jsonpickle compatible
-        d = self.__dict__.copy()
-        d["py/object"] = self.__full_path__
-#        print(self.__full_path__)
-        d["json_version"] = 1
-
-        d['all_methods'] = list(d['all_methods'])
-        d['tabular_data_interpolators'] = {}
-
-        ignored = ('correlations', 'extrapolation_coeffs')
-        for i in ignored:
-            try: del d[i]
-            except: pass
-
-        if hasattr(self, 'all_methods_P'):
-            d['all_methods_P'] = list(d['all_methods_P'])
-            d['tabular_data_interpolators_P'] = {}
-
-        del_objs = references == 0
+        skip = {'correlations', 'extrapolation_coeffs'}
+        obj_refs = {}
         for name in self.pure_references:
             prop_obj = getattr(self, name)
             if prop_obj is not None and type(prop_obj) not in (float, int):
-                if del_objs:
-                    del d[name]
+                if references == 0:
+                    skip.add(name)
                 else:
-                    d[name] = prop_obj.as_json()
+                    obj_refs[name] = prop_obj.as_json()
+
+        d = {"py/object": self.__full_path__, "json_version": 1}
+        for k, v in self.__dict__.items():
+            if k not in skip:
+                d[k] = v
+        d.update(obj_refs)
+
+        d['all_methods'] = list(self.all_methods)
+        d['tabular_data_interpolators'] = {}
+        if hasattr(self, 'all_methods_P'):
+            d['all_methods_P'] = list(self.all_methods_P)
+            d['tabular_data_interpolators_P'] = {}
 
         for name in self._json_obj_by_CAS:
             CASRN = self.CASRN
@@ -1195,10 +1232,8 @@ class TDependentProperty(object):
 
     @classmethod
     def _load_json_CAS_references(cls, d):
-        try:
+        if 'CP_f' in d:
             d['CP_f'] = coolprop_fluids[d['CP_f']]
-        except:
-            pass
 
     @classmethod
     def from_json(cls, json_repr):
@@ -1225,18 +1260,13 @@ class TDependentProperty(object):
         '''
         d = json_repr#serialize.json.loads(json_repr)
         cls._load_json_CAS_references(d)
-        try:
-            eos = d['eos']
-            if eos is not None:
-                d['eos'] = [GCEOS.from_json(eos)]
-        except:
-            pass
+        eos = d.get('eos', None)
+        if eos:
+            d['eos'] = [GCEOS.from_json(eos)]
 
         d['all_methods'] = set(d['all_methods'])
-        try:
+        if 'all_methods_P' in d:
             d['all_methods_P'] = set(d['all_methods_P'])
-        except:
-            pass
         d['T_limits'] = {k: tuple(v) for k, v in d['T_limits'].items()}
         d['tabular_data'] = {k: tuple(v) for k, v in d['tabular_data'].items()}
 
@@ -1249,9 +1279,8 @@ class TDependentProperty(object):
                     
 
         d['correlations'] = correlations = {}
-        for correlation_name in cls.correlation_models.keys():
+        for correlation_name, correlation_key in cls.correlation_parameters.items():
             # Should be lazy created?
-            correlation_key = cls.correlation_parameters[correlation_name]
             if correlation_key in d:
                 call = cls.correlation_models[correlation_name][2]['f']
                 for model_name, kwargs in d[correlation_key].items():
@@ -1269,8 +1298,9 @@ class TDependentProperty(object):
 
     @classmethod
     def _fit_export_polynomials(cls, method=None, start_n=3, max_n=30,
-                                eval_pts=100, save=False):
+                                eval_pts=100, save=False, max_workers=None):
         import json
+        from concurrent.futures import ProcessPoolExecutor
         dat = {}
         folder = os.path.join(source_path, cls.name)
 
@@ -1285,17 +1315,13 @@ class TDependentProperty(object):
             methods = [method]
             indexes = [sources[method]]
         for method, index in zip(methods, indexes):
-            method_dat = {}
             n = cls._fit_force_n.get(method, None)
             max_n_method = fit_max_n[method] if method in fit_max_n else max_n
-            for CAS in index:
-                print(CAS)
-                obj = cls(CASRN=CAS)
-                coeffs, (low, high), stats = obj.fit_polynomial(method, n=n, start_n=start_n, max_n=max_n_method, eval_pts=eval_pts)
-                max_error = max(abs(1.0 - stats[2]), abs(1.0 - stats[3]))
-                method_dat[CAS] = {'Tmax': high, 'Tmin': low, 'error_average': stats[0],
-                   'error_std': stats[1], 'max_error': max_error , 'method': method,
-                   'coefficients': coeffs}
+            fit_one = partial(_fit_export_polynomial, cls, method=method, n=n,
+                              start_n=start_n, max_n=max_n_method, eval_pts=eval_pts)
+            # Each chemical is fit independently, so spread them over processes
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                method_dat = dict(zip(index, executor.map(fit_one, index)))
 
             if save:
                 f = open(os.path.join(folder, method + '_polyfits.json'), 'w')
@@ -1477,7 +1503,11 @@ class TDependentProperty(object):
             fit_func_dict = fluids.numba.numerics.fit_minimization_targets
         else:
             fit_func_dict = fit_minimization_targets
-        if len(Ts) != len(data):
+        # So long as the fitting things happen with scipy, arrays are needed;
+        # inputs which are already contiguous float64 arrays are not copied
+        Ts = np.ascontiguousarray(Ts, dtype=np.float64)
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        if Ts.shape != data.shape:
             raise ValueError("Length of data and temperatures is not the same")
         if model not in cls.available_correlations:
             raise ValueError("Model is not available; available models are %s" %(cls.available_correlations,))
@@ -1489,11 +1519,6 @@ class TDependentProperty(object):
             solver_kwargs = {}
         if objective != 'MeanSquareErr' and fit_method != 'differential_evolution':
             raise ValueError("Specified objective is not supported with the specified solver")
-        # if use_numba:
-        # So long as the fitting things happen with scipy, arrays are needed
-        Ts = np.array(Ts)
-        data = np.array(data)
-        
         required_args, optional_args, functions, fit_data = cls.correlation_models[model]
         fit_parameters = fit_data['fit_params']
         all_fit_parameters = fit_parameters
@@ -1530,33 +1555,27 @@ class TDependentProperty(object):
                 if k in guesses:
                     p0[i] = guesses[k]
                     
-        if 'initial_guesses' in fit_data:
+        if 'initial_guesses' in fit_data and fit_parameters:
             # iterate over all the initial guess parameters we have and find the one
             # with the lowest error (according to the error criteria)
-            best_hardcoded_guess = None
-            best_hardcoded_err = 1e300
-            hardcoded_errors = []
             hardcoded_guesses = fit_data['initial_guesses']
             extra_user_guess = [{k: v for k, v in zip(use_fit_parameters, p0)}]
             all_iter_guesses = hardcoded_guesses + extra_user_guess
-            array_init_guesses = []
-            err_func_init = fit_func_dict['MeanRelErr']
-            for hardcoded in all_iter_guesses:
-                ph = [None]*len(fit_parameters)
-                for i, k in enumerate(use_fit_parameters):
-                    ph[i] = hardcoded[k]
-                array_init_guesses.append(ph)
-                
-                calc = fitting_func(Ts, *ph)
-                err = err_func_init(data, calc)
-                hardcoded_errors.append(err)
-                if err < best_hardcoded_err:
-                    best_hardcoded_err = err
-                    best_hardcoded_guess = ph
-            p0 = best_hardcoded_guess
-            array_init_guesses = [p0 for _, p0 in sorted(zip(hardcoded_errors, array_init_guesses))]
+            array_init_guesses = [[hardcoded[k] for k in use_fit_parameters]
+                                  for hardcoded in all_iter_guesses]
+            # Evaluate every guess at once by broadcasting a column of each
+            # parameter against the row of temperatures
+            P = np.array(array_init_guesses, dtype=float)
+            calcs = fitting_func(Ts, *[P[:, i:i+1] for i in range(len(fit_parameters))])
+            calcs = np.broadcast_to(calcs, (len(array_init_guesses), len(Ts)))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rel_errs = np.where(data == 0.0, (calcs != 0.0)*1.0, np.abs((data - calcs)/data))
+            hardcoded_errors = rel_errs.mean(axis=1)
+            # Rows of the sorted guess array are used directly by every solver
+            array_init_guesses = P[np.argsort(hardcoded_errors, kind='stable')]
+            p0 = array_init_guesses[0]
         else:
-            array_init_guesses = [p0]
+            array_init_guesses = np.array([p0], dtype=float)
         
         if 'fit_jac' in fit_data:
             analytical_jac_coded = fit_data['fit_jac']
@@ -1576,7 +1595,10 @@ class TDependentProperty(object):
             return analytical_jac(Ts, *params)
 
         pcov = None
-        if fit_method == 'differential_evolution':
+        if not fit_parameters:
+            # Every parameter was specified in model_kwargs; nothing to solve for
+            popt = ()
+        elif fit_method == 'differential_evolution':
             if 'bounds' in solver_kwargs:
                 working_bounds = solver_kwargs.pop('bounds')
             else:
@@ -1586,19 +1608,23 @@ class TDependentProperty(object):
                 except KeyError:
                     factor = 4.0
                     if len(array_init_guesses) > 3:
-                        lowers_guess, uppers_guess = np.array(array_init_guesses).min(axis=0), np.array(array_init_guesses).max(axis=0)
-                        working_bounds = [(lowers_guess[i]*factor if lowers_guess[i] < 0. else lowers_guess[i]*(1.0/factor),
-                                           uppers_guess[i]*(1.0/factor) if uppers_guess[i] < 0. else uppers_guess[i]*(factor),
-                                           ) for i in range(len(use_fit_parameters))]
+                        inv_factor = 1.0/factor
+                        lowers_guess, uppers_guess = array_init_guesses.min(axis=0), array_init_guesses.max(axis=0)
+                        working_bounds = np.column_stack([np.where(lowers_guess < 0., lowers_guess*factor, lowers_guess*inv_factor),
+                                                          np.where(uppers_guess < 0., uppers_guess*inv_factor, uppers_guess*factor)])
                     else:
                         working_bounds = [(-1e30, 1e30) for k in use_fit_parameters]
             popsize = solver_kwargs.get('popsize', 15)*len(fit_parameters)
-            init = array_init_guesses
-            for i in range(len(init), popsize):
-                to_add = [uniform(ll, lh) for ll, lh in working_bounds]
-                init.append(to_add)
+            N_guesses, N_params = len(array_init_guesses), len(fit_parameters)
+            init = np.empty((max(popsize, N_guesses), N_params))
+            init[:N_guesses] = array_init_guesses
+            if popsize > N_guesses:
+                # Fill the rest of the population randomly within the bounds,
+                # drawing from `random` so seeding it reproduces the fit
+                init[N_guesses:] = [[uniform(ll, lh) for ll, lh in working_bounds]
+                                    for _ in range(popsize - N_guesses)]
                 
-            res = differential_evolution(minimize_func, init=np.array(init),
+            res = differential_evolution(minimize_func, init=init,
                                          bounds=working_bounds, **solver_kwargs)
             popt = res['x']
         else:
@@ -1734,16 +1760,26 @@ class TDependentProperty(object):
         minimum limits controlled by the variables :obj:`property_min` and
         :obj:`property_max`.
 
+        An array of properties may also be given, in which case the checks
+        are applied element-wise and a boolean array is returned.
+
         Parameters
         ----------
-        prop : float
+        prop : float or ndarray
             property to be tested, [`units`]
 
         Returns
         -------
-        validity : bool
+        validity : bool or ndarray
             Whether or not a specifid method is valid
         '''
+        if type(prop) is float:
+            # Common case; NaN is not rejected here, same as below
+            return not (prop < self.property_min or prop > self.property_max)
+        if isinstance(prop, np.ndarray):
+            if np.iscomplexobj(prop):
+                return np.zeros(prop.shape, dtype=bool)
+            return ~((prop < self.property_min) | (prop > self.property_max))
         if isinstance(prop, complex):
             return False
         elif prop < self.property_min:
@@ -1767,11 +1803,11 @@ class TDependentProperty(object):
             self.poly_fit_int_coeffs = polyint(poly_fit_coeffs)
             self.poly_fit_T_int_T_coeffs, self.poly_fit_log_coeff = polyint_over_x(poly_fit_coeffs)
 
+            # polyder works on coefficients in ascending order; horner wants descending
             poly_fit_d_coeffs = polyder(poly_fit_coeffs[::-1])
-            self.poly_fit_d2_coeffs = polyder(poly_fit_d_coeffs)
-            self.poly_fit_d2_coeffs.reverse()
-            self.poly_fit_d_coeffs = poly_fit_d_coeffs
-            poly_fit_d_coeffs.reverse()
+            poly_fit_d2_coeffs = polyder(poly_fit_d_coeffs)
+            self.poly_fit_d_coeffs = poly_fit_d_coeffs[::-1]
+            self.poly_fit_d2_coeffs = poly_fit_d2_coeffs[::-1]
 
             # Extrapolation slope on high and low
             slope_delta_T = (self.poly_fit_Tmax - self.poly_fit_Tmin)*.05
@@ -1864,6 +1900,51 @@ class TDependentProperty(object):
         # Function returns None if it does not work.
         return None
 
+    def _calculate_extrapolate_array(self, Ts, method):
+        # Array counterpart of _calculate_extrapolate for a 1D float array;
+        # points which would give None there are NaN here
+        props = np.full(Ts.shape, nan)
+        if method is None:
+            return props
+        if method == POLY_FIT:
+            in_range = np.ones(Ts.shape, dtype=bool)
+        else:
+            try:
+                T_low, T_high = self.T_limits[method]
+                in_range = (Ts >= T_low) & (Ts <= T_high)
+            except KeyError:
+                in_range = np.array([self.test_method_validity(T, method) for T in Ts.tolist()], dtype=bool)
+
+        if in_range.any():
+            Ts_in = Ts[in_range]
+            try:
+                vals = np.asarray(self.calculate(Ts_in, method))
+                if vals.shape != Ts_in.shape:
+                    vals = None
+            except:
+                vals = None
+            if vals is not None:
+                if method == POLY_FIT:
+                    valid = np.ones(vals.shape, dtype=bool) if vals.dtype.kind != 'c' else np.zeros(vals.shape, dtype=bool)
+                else:
+                    valid = self.test_property_validity(vals)
+                in_vals = np.full(vals.shape, nan)
+                in_vals[valid] = vals[valid]
+                props[in_range] = in_vals
+            else:
+                for i in np.flatnonzero(in_range).tolist():
+                    v = self._calculate_extrapolate(float(Ts[i]), method)
+                    if v is not None:
+                        props[i] = v
+
+        if self._extrapolation is not None:
+            for i in np.flatnonzero(~in_range).tolist():
+                try:
+                    props[i] = self.extrapolate(float(Ts[i]), method)
+                except:
+                    pass
+        return props
+
     def T_dependent_property(self, T):
         r'''Method to calculate the property with sanity checking and using
         the selected :obj:`method <thermo.utils.TDependentProperty.method>`.
@@ -1918,6 +1999,38 @@ class TDependentProperty(object):
             elif self.RAISE_PROPERTY_CALCULATION_ERROR: 
                 raise RuntimeError("%s method '%s' is not valid at T=%s K for component with CASRN '%s'" %(self.name, method, T, self.CASRN))
 
+    def T_dependent_property_array(self, Ts):
+        r'''Method to calculate the property at an array of temperatures with
+        the same sanity checking as
+        :obj:`T_dependent_property <thermo.utils.TDependentProperty.T_dependent_property>`.
+
+        The points within the temperature limits of the selected method are
+        evaluated with a single call to `calculate` if the method supports
+        array inputs, and point by point otherwise. Points outside the limits
+        are extrapolated individually. Wherever
+        :obj:`T_dependent_property <thermo.utils.TDependentProperty.T_dependent_property>`
+        would return None, NaN is returned instead.
+
+        Parameters
+        ----------
+        Ts : array-like
+            Temperatures at which to calculate the property, [K]
+
+        Returns
+        -------
+        props : ndarray
+            Calculated property, [`units`]
+        '''
+        Ts = np.asarray(Ts, dtype=float)
+        shape = Ts.shape
+        Ts = Ts.ravel()
+        method = self._method
+        if method is None or self.RAISE_PROPERTY_CALCULATION_ERROR:
+            props = [self.T_dependent_property(T) for T in Ts.tolist()]
+            return np.array([nan if v is None else v for v in props], dtype=float).reshape(shape)
+
+        return self._calculate_extrapolate_array(Ts, method).reshape(shape)
+
     def plot_T_dependent_property(self, Tmin=None, Tmax=None, methods=[],
                                   pts=250, only_valid=True, order=0, show=True,
                                   axes='semilogy'):
@@ -1973,27 +2086,20 @@ class TDependentProperty(object):
 #        ax.set_color_cycle([cm(1.*i/NUM_COLORS) for i in range(NUM_COLORS)])
 
         plot_fun = {'semilogy': plt.semilogy, 'semilogx': plt.semilogx, 'plot': plt.plot}[axes]
-        Ts = linspace(Tmin, Tmax, pts)
+        Ts = np.array(linspace(Tmin, Tmax, pts))
         if order == 0:
             for method in methods:
                 fmt = '-'
                 if method in tabular_data:
                     fmt = 'x'
                 
+                properties = self._calculate_extrapolate_array(Ts, method)
                 if only_valid:
-                    properties, Ts2 = [], []
-                    for T in Ts:
-                        if self.test_method_validity(T, method):
-                            try:
-                                p = self._calculate_extrapolate(T=T, method=method)
-                                if self.test_property_validity(p):
-                                    properties.append(p)
-                                    Ts2.append(T)
-                            except:
-                                pass
-                    plot_fun(Ts2, properties, fmt, label=method)
+                    mask = np.array([self.test_method_validity(T, method) for T in Ts.tolist()], dtype=bool)
+                    mask &= ~np.isnan(properties)
+                    mask &= self.test_property_validity(properties)
+                    plot_fun(Ts[mask], properties[mask], fmt, label=method)
                 else:
-                    properties = [self._calculate_extrapolate(T=T, method=method) for T in Ts]
                     plot_fun(Ts, properties, fmt, label=method)
             plt.ylabel(self.name + ', ' + self.units)
             title = self.name
@@ -2041,7 +2147,6 @@ class TDependentProperty(object):
         :obj:`interpolation_property`, and :obj:`interpolation_property_inv` if set. If
         any of these are changed after the interpolators were first created,
         new interpolators are created with the new transforms.
-        All interpolation is performed via the `interp1d` function.
 
         Parameters
         ----------
@@ -2065,22 +2170,26 @@ class TDependentProperty(object):
         if key in self.tabular_data_interpolators:
             extrapolator, spline = self.tabular_data_interpolators[key]
         else:
-            from scipy.interpolate import interp1d
             Ts, properties = self.tabular_data[name]
 
+            N = len(Ts)
             if self.interpolation_T is not None:  # Transform ths Ts with interpolation_T if set
-                Ts_interp = [self.interpolation_T(T) for T in Ts]
+                Ts_interp = np.fromiter(map(self.interpolation_T, Ts), dtype=float, count=N)
             else:
-                Ts_interp = Ts
+                Ts_interp = np.asarray(Ts, dtype=float)
             if self.interpolation_property is not None:  # Transform ths props with interpolation_property if set
-                properties_interp = [self.interpolation_property(p) for p in properties]
+                properties_interp = np.fromiter(map(self.interpolation_property, properties), dtype=float, count=N)
             else:
-                properties_interp = properties
+                properties_interp = np.asarray(properties, dtype=float)
+            # The transformed temperatures may be decreasing, e.g. 1/T
+            order = np.argsort(Ts_interp, kind='mergesort')
+            Ts_interp, properties_interp = Ts_interp[order], properties_interp[order]
             # Only allow linear extrapolation, but with whatever transforms are specified
-            extrapolator = interp1d(Ts_interp, properties_interp, fill_value='extrapolate')
+            extrapolator = _LinearInterpolator(Ts_interp, properties_interp)
             # If more than 5 property points, create a spline interpolation
             if len(properties) >= 5:
-                spline = interp1d(Ts_interp, properties_interp, kind='cubic')
+                from scipy.interpolate import CubicSpline
+                spline = _CubicSplineEvaluator(CubicSpline(Ts_interp, properties_interp))
             else:
                 spline = None
 #            if isinstance(self.tabular_data_interpolators, dict):
@@ -2372,15 +2481,12 @@ class TDependentProperty(object):
         derivative : float
             Calculated derivative property, [`units/K^order`]
         '''
-        if method in self.correlations:
-            _, model_kwargs, model = self.correlations[method]
-            calls = self.correlation_models[model][2]
-            if order == 1 and 'f_der' in calls:
-                return calls['f_der'](T, **model_kwargs)
-            elif order == 2 and 'f_der2' in calls:
-                return calls['f_der2'](T, **model_kwargs)
-            elif order == 3 and 'f_der3' in calls:
-                return calls['f_der3'](T, **model_kwargs)
+        correlation = self.correlations.get(method)
+        if correlation is not None:
+            _, model_kwargs, model = correlation
+            f_der = self.correlation_models[model][2].get(_correlation_derivative_calls.get(order))
+            if f_der is not None:
+                return f_der(T, **model_kwargs)
         
         Tmin, Tmax = self.T_limits[method]
         in_range = Tmin <= T <= Tmax
@@ -2406,6 +2512,85 @@ class TDependentProperty(object):
             raise ValueError("temperature is outside the valid range")
 #
 
+    def _calculate_derivative_array(self, Ts, method, order):
+        # Array counterpart of calculate_derivative for a 1D float array;
+        # points at which it would raise are NaN here
+        derivs = np.full(Ts.shape, nan)
+
+        def fill_pointwise(idxs):
+            for i in idxs:
+                try:
+                    derivs[i] = self.calculate_derivative(float(Ts[i]), method, order)
+                except:
+                    pass
+
+        def call_array(f, Ts_f, *args):
+            try:
+                vals = np.asarray(f(Ts_f, *args), dtype=float)
+                if vals.shape == Ts_f.shape:
+                    return vals
+            except:
+                pass
+            return None
+
+        if (method is None or method not in self.T_limits
+            or type(self).calculate_derivative is not TDependentProperty.calculate_derivative):
+            # Subclasses with their own calculate_derivative keep its logic
+            fill_pointwise(range(len(Ts)))
+            return derivs
+
+        correlation = self.correlations.get(method)
+        if correlation is not None:
+            _, model_kwargs, model = correlation
+            f_der = self.correlation_models[model][2].get(_correlation_derivative_calls.get(order))
+            if f_der is not None:
+                vals = call_array(lambda T: f_der(T, **model_kwargs), Ts)
+                if vals is not None:
+                    return vals
+                fill_pointwise(range(len(Ts)))
+                return derivs
+
+        Tmin, Tmax = self.T_limits[method]
+        in_range = (Ts >= Tmin) & (Ts <= Tmax)
+        idx_in = np.flatnonzero(in_range)
+        Ts_in = Ts[idx_in]
+        vals, analytical = None, False
+        if method in self.local_methods and len(Ts_in):
+            local_method = self.local_methods[method]
+            f_der = (local_method.f_der, local_method.f_der2, local_method.f_der3)[order-1] if 1 <= order <= 3 else None
+            if f_der is not None:
+                analytical = True
+                vals = call_array(f_der, Ts_in)
+        if not analytical and len(Ts_in) and order >= 1:
+            # Same central difference stencil and limit handling as derivative
+            pts = 1 + order*2
+            ho = pts >> 1
+            weights = central_diff_weights(pts, order)
+            dx = Ts_in*1e-6
+            x0 = Ts_in
+            max_x = x0 + (pts - 1 - ho)*dx
+            x0 = np.where(max_x > Tmax, x0 - (max_x - x0), x0)
+            min_x = x0 + -ho*dx
+            x0 = np.where(min_x < Tmin, x0 + (x0 - min_x), x0)
+            ks = [k for k in range(pts) if weights[k] != 0.0]
+            stencil = np.concatenate([x0 + (k - ho)*dx for k in ks])
+            fs = call_array(self.calculate, stencil, method)
+            if fs is not None:
+                fs = fs.reshape(len(ks), len(Ts_in))
+                vals = 0.0
+                for j, k in enumerate(ks):
+                    vals = vals + weights[k]*fs[j]
+                denominator = 1.0
+                for _ in range(order):
+                    denominator = denominator*dx
+                vals = vals*(1.0/denominator)
+        if vals is not None:
+            derivs[idx_in] = vals
+        else:
+            fill_pointwise(idx_in.tolist())
+        fill_pointwise(np.flatnonzero(~in_range).tolist())
+        return derivs
+
     def T_dependent_property_derivative(self, T, order=1):
         r'''Method to obtain a derivative of a property with respect to
         temperature, of a given order.
@@ -2430,6 +2615,33 @@ class TDependentProperty(object):
         '''
         return self.calculate_derivative(T, self._method, order)
 
+    def T_dependent_property_derivative_array(self, Ts, order=1):
+        r'''Method to obtain a derivative of a property with respect to
+        temperature, of a given order, at an array of temperatures.
+
+        The selected method is resolved once; analytical derivatives and the
+        finite difference stencil used by :obj:`calculate_derivative` are
+        evaluated with array calls where the method supports them, and point
+        by point otherwise. Wherever :obj:`calculate_derivative` would raise,
+        NaN is returned instead.
+
+        Parameters
+        ----------
+        Ts : array-like
+            Temperatures at which to calculate the derivative, [K]
+        order : int
+            Order of the derivative, >= 1
+
+        Returns
+        -------
+        derivatives : ndarray
+            Calculated derivative property, [`units/K^order`]
+        '''
+        Ts = np.asarray(Ts, dtype=float)
+        shape = Ts.shape
+        Ts = Ts.ravel()
+        return self._calculate_derivative_array(Ts, self._method, order).reshape(shape)
+
     def calculate_integral(self, T1, T2, method):
         r'''Method to calculate the integral of a property with respect to
         temperature, using a specified method. Uses SciPy's `quad` function
@@ -2456,11 +2668,12 @@ class TDependentProperty(object):
             Calculated integral of the property over the given range,
             [`units*K`]
         '''
-        if method in self.correlations:
-            _, model_kwargs, model = self.correlations[method]
-            calls = self.correlation_models[model][2]
-            if 'f_int' in calls:
-                return calls['f_int'](T2, **model_kwargs) - calls['f_int'](T1, **model_kwargs)
+        correlation = self.correlations.get(method)
+        if correlation is not None:
+            _, model_kwargs, model = correlation
+            f_int = self.correlation_models[model][2].get('f_int')
+            if f_int is not None:
+                return f_int(T2, **model_kwargs) - f_int(T1, **model_kwargs)
         if method in self.local_methods:
             local_method = self.local_methods[method]
             if local_method.f_int is not None:
@@ -2522,11 +2735,12 @@ class TDependentProperty(object):
             Calculated integral of the property over the given range,
             [`units`]
         '''
-        if method in self.correlations:
-            _, model_kwargs, model = self.correlations[method]
-            calls = self.correlation_models[model][2]
-            if 'f_int_over_T' in calls:
-                return calls['f_int_over_T'](T2, **model_kwargs) - calls['f_int_over_T'](T1, **model_kwargs)
+        correlation = self.correlations.get(method)
+        if correlation is not None:
+            _, model_kwargs, model = correlation
+            f_int_over_T = self.correlation_models[model][2].get('f_int_over_T')
+            if f_int_over_T is not None:
+                return f_int_over_T(T2, **model_kwargs) - f_int_over_T(T1, **model_kwargs)
         if method in self.local_methods:
             local_method = self.local_methods[method]
             if local_method.f_int_over_T is not None:
@@ -2646,7 +2860,6 @@ class TDependentProperty(object):
                 v0_high, v1_high, n_high = None, None, None
             coefficients = [v0_low, n_low, v0_high, n_high]
         elif extrapolation == 'interp1d':
-            from scipy.interpolate import interp1d
             interpolation_T = self.interpolation_T
             interpolation_property = self.interpolation_property
             interpolation_property_inv = self.interpolation_property_inv
@@ -2665,8 +2878,13 @@ class TDependentProperty(object):
                 properties_interp = [interpolation_property(p) for p in properties]
             else:
                 properties_interp = properties
-            # Only allow linear extrapolation, but with whatever transforms are specified
-            extrapolator = interp1d(Ts_interp, properties_interp, fill_value='extrapolate', kind=self.interp1d_extrapolate_kind)
+            if self.interp1d_extrapolate_kind == 'linear':
+                Ts_interp = np.asarray(Ts_interp, dtype=float)
+                order = np.argsort(Ts_interp, kind='mergesort')
+                extrapolator = _LinearInterpolator(Ts_interp[order], np.asarray(properties_interp, dtype=float)[order])
+            else:
+                from scipy.interpolate import interp1d
+                extrapolator = interp1d(Ts_interp, properties_interp, fill_value='extrapolate', kind=self.interp1d_extrapolate_kind)
             coefficients = extrapolator
         elif extrapolation is None or extrapolation == 'None':
             coefficients = None
@@ -2736,11 +2954,10 @@ class TDependentProperty(object):
         else:
             raise ValueError("Not outside normal range")
         key = (extrapolation, method)
-        extrapolation_coeffs = self.extrapolation_coeffs
-        if key in extrapolation_coeffs:
-            coeffs = extrapolation_coeffs[key]
-        else:
-            extrapolation_coeffs[key] = coeffs = self._get_extrapolation_coeffs(extrapolation, method)
+        try:
+            coeffs = self.extrapolation_coeffs[key]
+        except KeyError:
+            self.extrapolation_coeffs[key] = coeffs = self._get_extrapolation_coeffs(extrapolation, method)
             
         if extrapolation == 'linear':
             v_low, d_low, v_high, d_high = coeffs
@@ -2775,7 +2992,6 @@ class TDependentProperty(object):
                 return v_high
 
         elif extrapolation == 'AntoineAB':
-            T_low, T_high = T_limits[method]
             AB_low, AB_high = coeffs
             if low:
                 if AB_low is None:
@@ -2786,7 +3002,6 @@ class TDependentProperty(object):
                     raise ValueError("Could not extrapolate - model failed to calculate at maximum temperature")
                 return Antoine(T, A=AB_high[0], B=AB_high[1], C=0.0, base=e)
         elif extrapolation == 'DIPPR101_ABC':
-            T_low, T_high = T_limits[method]
             DIPPR101_ABC_low, DIPPR101_ABC_high = coeffs
             if low:
                 if DIPPR101_ABC_low is None:
@@ -2797,7 +3012,6 @@ class TDependentProperty(object):
                     raise ValueError("Could not extrapolate - model failed to calculate at maximum temperature")
                 return EQ101(T, DIPPR101_ABC_high[0], DIPPR101_ABC_high[1], DIPPR101_ABC_high[2], 0.0, 0.0)
         elif extrapolation == 'Watson':
-            T_low, T_high = T_limits[method]
             v0_low, n_low, v0_high, n_high = coeffs
             if low:
                 if v0_low is None:
@@ -2808,7 +3022,6 @@ class TDependentProperty(object):
                     raise ValueError("Could not extrapolate - model failed to calculate at maximum temperature")
                 return Watson(T, Hvap_ref=v0_high, T_ref=T_high, Tc=self.Tc, exponent=n_high)
         elif extrapolation == 'interp1d':
-            T_low, T_high = T_limits[method]
             extrapolator = coeffs
             interpolation_T = self.interpolation_T
             if interpolation_T is not None:
@@ -2835,7 +3048,7 @@ class TDependentProperty(object):
         tabular data; indexed by provided or autogenerated name.'''
         self.tabular_data_interpolators = {}
         '''tabular_data_interpolators, dict: Stored (extrapolator,
-        spline) tuples which are interp1d instances for each set of tabular
+        spline) tuples of callable interpolators for each set of tabular
         data; indexed by tuple of (name, interpolation_T,
         interpolation_property, interpolation_property_inv) to ensure that
         if an interpolation transform is altered, the old interpolator which